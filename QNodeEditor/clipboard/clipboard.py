@@ -211,3 +211,44 @@ class Clipboard:
             edge = Edge(scene=self.scene)
             edge.set_state(edge_state, socket_lookup)
             edge.graphics.setSelected(True)
+
+    def duplicate_selected(self) -> bool:
+        """
+        Duplicate the selected scene items directly, without going through a state dictionary.
+
+        Edges are only duplicated if the nodes on both ends are also selected. Afterward, only the
+        duplicated items are selected.
+
+        Returns
+        -------
+        bool
+            Whether any nodes were duplicated
+        """
+        # Clone the selected nodes and map their sockets to the sockets of the clones
+        nodes: list['Node'] = []
+        edges: list[Edge] = []
+        socket_lookup = {}
+        for item in self.scene.graphics.selectedItems():
+            if isinstance(item, NodeGraphics):
+                duplicate = item.node.clone()
+                nodes.append(duplicate)
+                socket_lookup.update(zip(item.node.sockets(), duplicate.sockets()))
+            elif isinstance(item, EdgeGraphics):
+                edges.append(item.edge)
+
+        # Stop if no nodes were duplicated
+        if len(nodes) == 0:
+            return False
+
+        # Add and select the duplicated nodes
+        self.scene.graphics.clearSelection()
+        for node in nodes:
+            self.scene.add_node(node)
+            node.graphics.setSelected(True)
+
+        # Connect the duplicated nodes like the original nodes (ignoring edges to other nodes)
+        for edge in edges:
+            if edge.start in socket_lookup and edge.end in socket_lookup:
+                duplicate = Edge(socket_lookup[edge.start], socket_lookup[edge.end], self.scene)
+                duplicate.graphics.setSelected(True)
+        return True
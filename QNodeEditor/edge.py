@@ -173,10 +173,8 @@ class Edge(QObject, metaclass=ObjectMeta):
             raise ValueError(f'Unknown edge type "{self.theme.edge_type}"')
 
         # Revert to the old positions if they are available
-        if old_start is not None:
-            self.graphics.pos_start = old_start
-        if old_end is not None:
-            self.graphics.pos_end = old_end
+        if old_start is not None and old_end is not None:
+            self.graphics.set_positions(old_start, old_end)
 
         # Add new graphics to the scene (if it exists)
         if hasattr(self, 'scene') and self.scene is not None:
@@ -271,16 +269,18 @@ class Edge(QObject, metaclass=ObjectMeta):
             None
         """
         # Calculate start position
+        pos_start, pos_end = self.graphics.pos_start, self.graphics.pos_end
         if self.start is not None and self.start.entry.node is not None:
-            self.graphics.pos_start = self.start.graphics.get_scene_position()
+            pos_start = self.start.graphics.get_scene_position()
 
         # Calculate end position (use start position if None)
         if self.end is not None and self.end.entry.node is not None:
-            self.graphics.pos_end = self.end.graphics.get_scene_position()
+            pos_end = self.end.graphics.get_scene_position()
         elif self.start is not None and self.start.entry.node is not None:
-            self.graphics.pos_end = self.start.graphics.get_scene_position()
+            pos_end = pos_start
 
-        self.graphics.update()
+        # Update both positions with a single repaint
+        self.graphics.set_positions(pos_start, pos_end)
 
     def remove_from_sockets(self) -> None:
         """
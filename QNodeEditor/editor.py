@@ -45,7 +45,8 @@ class NodeEditor(QWidget):
 
     def __init__(self, parent: QWidget = None,
                  theme: ThemeType = DarkTheme,
-                 allow_multiple_inputs: bool = False):
+                 allow_multiple_inputs: bool = False,
+                 use_opengl: bool = False):
         """
         Create a new node editor widget.
 
@@ -58,6 +59,9 @@ class NodeEditor(QWidget):
         allow_multiple_inputs : bool
             If set to True, multiple edges can be connected to the same node input. Otherwise, only
             a single edge can be connected to any input.
+        use_opengl : bool
+            If set to True, the node editor is painted by the GPU using OpenGL. Otherwise, it is
+            painted in software.
         """
         super().__init__(parent)
 
@@ -69,7 +73,8 @@ class NodeEditor(QWidget):
         # Create node scene and view
         self.scene: NodeScene = NodeScene(self)
         self.view: NodeView = NodeView(self.scene.graphics,
-                                       allow_multiple_inputs=allow_multiple_inputs)
+                                       allow_multiple_inputs=allow_multiple_inputs,
+                                       use_opengl=use_opengl)
         layout.addWidget(self.view)
 
         # Set node editor theme
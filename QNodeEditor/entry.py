@@ -312,6 +312,10 @@ class Entry(QObject, metaclass=ObjectMeta):
             self._socket.connected.connect(self.edge_connected.emit)
             self._socket.disconnected.connect(self.edge_disconnected.emit)
 
+        # Let the node know its sockets changed
+        if self.node is not None and self.node.graphics is not None:
+            self.node.graphics.invalidate_sockets()
+
     def update_geometry(self) -> None:
         """
         Update the position and width of the entry based on the node settings.
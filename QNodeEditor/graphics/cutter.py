@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 
 from PyQt5.QtWidgets import QGraphicsItem
 from PyQt5.QtCore import QPointF, Qt, QRectF, QPoint
-from PyQt5.QtGui import QPen, QPainter, QPainterPath, QPolygonF
+from PyQt5.QtGui import QPen, QPainter, QPainterPath
 
 from QNodeEditor.themes import ThemeType, DarkTheme
 if TYPE_CHECKING:
@@ -35,8 +35,10 @@ class Cutter(QGraphicsItem):
         super().__init__(parent)
         self.scene: 'NodeScene' = scene
 
-        # Create tracking variables
+        # Create tracking variables (path and bounding rectangle are updated with every point)
         self._points: list[QPointF] = []
+        self._path: QPainterPath = QPainterPath()
+        self._bounding_rect: QRectF = QRectF()
 
         # Create drawing utilities
         self._pen: QPen = QPen()
@@ -55,10 +57,12 @@ class Cutter(QGraphicsItem):
         -------
             None
         """
+        self.prepareGeometryChange()
         self._points.clear()
+        self._path = QPainterPath()
+        self._bounding_rect = QRectF()
         if position is not None:
             self.add_point(position)
-        self.update()
 
     def add_point(self, position: QPoint or QPointF) -> None:
         """
@@ -73,8 +77,29 @@ class Cutter(QGraphicsItem):
         -------
             None
         """
-        self._points.append(QPointF(position))
-        self.update()
+        point = QPointF(position)
+        self.prepareGeometryChange()
+        self._points.append(point)
+        if len(self._points) == 1:
+            self._path.moveTo(point)
+        else:
+            self._path.lineTo(point)
+        self._update_bounding_rect()
+
+    def _update_bounding_rect(self) -> None:
+        """
+        Update the bounding rectangle to the cutting line path (including the pen width).
+
+        Returns
+        -------
+            None
+        """
+        if len(self._points) < 2:
+            self._bounding_rect = QRectF()
+        else:
+            margin = self._pen.widthF() / 2 + 1
+            self._bounding_rect = self._path.boundingRect().adjusted(-margin, -margin,
+                                                                     margin, margin)
 
     def cut(self) -> None:
         """
@@ -110,6 +135,8 @@ class Cutter(QGraphicsItem):
         self._pen = QPen(new_theme.editor_color_cut)
         self._pen.setWidthF(new_theme.editor_cut_width)
         self._pen.setDashPattern(new_theme.editor_cut_dash_pattern)
+        self.prepareGeometryChange()
+        self._update_bounding_rect()
 
     def boundingRect(self) -> QRectF:
         """
@@ -122,7 +149,7 @@ class Cutter(QGraphicsItem):
 
         :meta private:
         """
-        return self.shape().boundingRect()
+        return self._bounding_rect
 
     def shape(self) -> QPainterPath:
         """
@@ -135,17 +162,7 @@ class Cutter(QGraphicsItem):
 
         :meta private:
         """
-        # If there are at least two points, create a path
-        if len(self._points) > 1:
-            path = QPainterPath(self._points[0])
-            for point in self._points[1:]:
-                path.lineTo(point)
-
-        # Otherwise, create a default path
-        else:
-            path = QPainterPath(QPointF(0, 0))
-            path.lineTo(QPointF(1, 1))
-        return path
+        return self._path
 
     def paint(self, painter: QPainter, *_) -> None:
         """
@@ -167,6 +184,5 @@ class Cutter(QGraphicsItem):
         painter.setBrush(Qt.NoBrush)
         painter.setPen(self._pen)
 
-        # Draw cutting line as polygon
-        polygon = QPolygonF(self._points)
-        painter.drawPolyline(polygon)
+        # Draw cutting line path
+        painter.drawPath(self._path)
@@ -3,11 +3,12 @@ Module containing extensions of QGraphicsPathItem representing various edge type
 """
 # pylint: disable = no-name-in-module, C0103
 from abc import abstractmethod
+from math import sqrt, acos, cos, pi, copysign
 from typing import TYPE_CHECKING
 
 from PyQt5.QtWidgets import QGraphicsPathItem, QGraphicsItem
 from PyQt5.QtCore import Qt, QRectF, QPointF, QPoint
-from PyQt5.QtGui import QPainter, QPen, QPainterPath
+from PyQt5.QtGui import QPainter, QPen, QPainterPath, QPainterPathStroker
 
 from QNodeEditor.entry import Entry
 from QNodeEditor.themes import ThemeType, DarkTheme
@@ -43,6 +44,9 @@ class EdgeGraphics(QGraphicsPathItem, metaclass=GraphicsPathItemMeta):
         self._hovered: bool = False
         self._pos_start: QPointF = QPointF(0, 0)
         self._pos_end: QPointF = QPointF(0, 0)
+        self._stroker: QPainterPathStroker = QPainterPathStroker()
+        self._shape: QPainterPath = QPainterPath()
+        self._bounding_rect: QRectF = QRectF()
         self.theme: ThemeType = theme
 
         # Set item flags
@@ -50,6 +54,22 @@ class EdgeGraphics(QGraphicsPathItem, metaclass=GraphicsPathItemMeta):
         self.setFlag(QGraphicsItem.ItemIsSelectable)
         self.setZValue(-1)
 
+    @property
+    def theme(self) -> ThemeType:
+        """
+        Get or set the theme of the edge graphics.
+        """
+        return self._theme
+
+    @theme.setter
+    def theme(self, new_theme: ThemeType) -> None:
+        self._theme = new_theme
+
+        # Make the shape wide enough to contain the edge in any state
+        self._stroker.setWidth(max(new_theme.edge_width_default, new_theme.edge_width_hover,
+                                   new_theme.edge_width_selected, new_theme.edge_width_drag))
+        self._update_path()
+
     @property
     def pos_start(self) -> QPointF:
         """
@@ -63,7 +83,7 @@ class EdgeGraphics(QGraphicsPathItem, metaclass=GraphicsPathItemMeta):
         if isinstance(new_start, QPoint):
             new_start = QPointF(new_start)
         self._pos_start = new_start
-        self.update()
+        self._update_path()
 
     @property
     def pos_end(self) -> QPointF:
@@ -78,7 +98,47 @@ class EdgeGraphics(QGraphicsPathItem, metaclass=GraphicsPathItemMeta):
         if isinstance(new_end, QPoint):
             new_end = QPointF(new_end)
         self._pos_end = new_end
-        self.update()
+        self._update_path()
+
+    def set_positions(self, new_start: QPointF or QPoint, new_end: QPointF or QPoint) -> None:
+        """
+        Set the scene starting and ending position of the edge at once.
+
+        The edge path is only rebuilt once, rather than once for every position.
+
+        Parameters
+        ----------
+        new_start : QPointF or QPoint
+            New scene starting position of the edge
+        new_end : QPointF or QPoint
+            New scene ending position of the edge
+
+        Returns
+        -------
+            None
+        """
+        # Ensure new positions are QPointF
+        if isinstance(new_start, QPoint):
+            new_start = QPointF(new_start)
+        if isinstance(new_end, QPoint):
+            new_end = QPointF(new_end)
+        self._pos_start = new_start
+        self._pos_end = new_end
+        self._update_path()
+
+    def _update_path(self) -> None:
+        """
+        Rebuild the edge path and the cached shape and bounding rectangle derived from it.
+
+        Returns
+        -------
+            None
+        """
+        self.prepareGeometryChange()
+        path = self.create_path()
+        self._shape = self._stroker.createStroke(path)
+        self._bounding_rect = self._shape.boundingRect()
+        self.setPath(path)
 
     def hoverEnterEvent(self, _) -> None:
         """
@@ -137,20 +197,20 @@ class EdgeGraphics(QGraphicsPathItem, metaclass=GraphicsPathItemMeta):
 
         :meta private:
         """
-        return self.shape().boundingRect()
+        return self._bounding_rect
 
     def shape(self) -> QPainterPath:
         """
-        Get the shape of the edge.
+        Get the shape of the edge (the edge path stroked with the widest edge pen).
 
         Returns
         -------
-        QRectF
+        QPainterPath
             Edge shape
 
         :meta private:
         """
-        return self.create_path()
+        return self._shape
 
     @abstractmethod
     def create_path(self) -> QPainterPath:
@@ -178,28 +238,26 @@ class EdgeGraphics(QGraphicsPathItem, metaclass=GraphicsPathItemMeta):
 
         :meta private:
         """
-        # Calculate edge path
-        self.setPath(self.create_path())
-
         # Set painter style based on edge state
+        theme, pen = self.theme, self._pen
         painter.setBrush(Qt.NoBrush)
         if self.edge.start is None or self.edge.end is None:
-            self._pen.setColor(self.theme.edge_color_drag)
-            self._pen.setWidthF(self.theme.edge_width_drag)
-            self._pen.setStyle(self.theme.edge_style_drag)
+            pen.setColor(theme.edge_color_drag)
+            pen.setWidthF(theme.edge_width_drag)
+            pen.setStyle(theme.edge_style_drag)
         elif self.isSelected():
-            self._pen.setColor(self.theme.edge_color_selected)
-            self._pen.setWidthF(self.theme.edge_width_selected)
-            self._pen.setStyle(self.theme.edge_style_selected)
+            pen.setColor(theme.edge_color_selected)
+            pen.setWidthF(theme.edge_width_selected)
+            pen.setStyle(theme.edge_style_selected)
         elif self._hovered:
-            self._pen.setColor(self.theme.edge_color_hover)
-            self._pen.setWidthF(self.theme.edge_width_hover)
-            self._pen.setStyle(self.theme.edge_style_hover)
+            pen.setColor(theme.edge_color_hover)
+            pen.setWidthF(theme.edge_width_hover)
+            pen.setStyle(theme.edge_style_hover)
         else:
-            self._pen.setColor(self.theme.edge_color_default)
-            self._pen.setWidthF(self.theme.edge_width_default)
-            self._pen.setStyle(self.theme.edge_style_default)
-        painter.setPen(self._pen)
+            pen.setColor(theme.edge_color_default)
+            pen.setWidthF(theme.edge_width_default)
+            pen.setStyle(theme.edge_style_default)
+        painter.setPen(pen)
 
         # Draw edge path
         painter.drawPath(self.path())
@@ -223,12 +281,56 @@ class DirectEdgeGraphics(EdgeGraphics):
         path.lineTo(self.pos_end)
         return path
 
+    def intersects_line(self, point1: QPointF, point2: QPointF) -> bool:
+        """
+        Checks whether a line segment intersects with this edge.
+
+        Uses a direct segment-segment intersection test instead of comparing painter paths.
+
+        Parameters
+        ----------
+        point1 : QPointF
+            Line segment starting point
+        point2 : QPointF
+            Line segment end point
+
+        Returns
+        -------
+        bool
+            Whether the line segment intersects the edge
+        """
+        return _segment_intersects_segment(point1, point2, self.pos_start, self.pos_end)
+
 
 class BezierEdgeGraphics(EdgeGraphics):
     """
     Edge graphics with a Bézier curve between edge start and end
     """
 
+    def control_points(self) -> tuple[QPointF, QPointF, QPointF, QPointF]:
+        """
+        Calculate the control points of the Bézier curve between the edge start and end point.
+
+        Returns
+        -------
+        tuple[QPointF, QPointF, QPointF, QPointF]
+            Start point, first control point, second control point, and end point of the curve
+        """
+        # Calculate control point offset (always pointing away from the starting socket side)
+        start, end = self._pos_start, self._pos_end
+        distance = (end.x() - start.x()) / 2
+        if self.edge.start is not None:
+            entry_type = self.edge.start.entry.entry_type
+            if entry_type == Entry.TYPE_OUTPUT:
+                distance = abs(distance)
+            elif entry_type == Entry.TYPE_INPUT:
+                distance = -abs(distance)
+
+        return (start,
+                QPointF(start.x() + distance, start.y()),
+                QPointF(end.x() - distance, end.y()),
+                end)
+
     def create_path(self) -> QPainterPath:
         """
         Create a Bézier curve between the edge start and end point
@@ -238,23 +340,199 @@ class BezierEdgeGraphics(EdgeGraphics):
         QPainterPath
             Bézier curve connecting start and end point
         """
-        # Calculate control point locations
-        distance = (self.pos_end.x() - self.pos_start.x()) / 2
-        control_x_start = distance
-        control_x_end = -distance
-
-        # Correct control points for edges going left
-        if self.edge.start is not None:
-            start_x, end_x = self.pos_start.x(), self.pos_end.x()
-            entry_type = self.edge.start.entry.entry_type
-            if ((start_x > end_x and entry_type == Entry.TYPE_OUTPUT) or
-                    (start_x < end_x and entry_type == Entry.TYPE_INPUT)):
-                control_x_start *= -1
-                control_x_end *= -1
-
         # Create path with cubic
-        path = QPainterPath(self.pos_start)
-        path.cubicTo(QPointF(self.pos_start.x() + control_x_start, self.pos_start.y()),
-                     QPointF(self.pos_end.x() + control_x_end, self.pos_end.y()),
-                     self.pos_end)
+        start, control1, control2, end = self.control_points()
+        path = QPainterPath(start)
+        path.cubicTo(control1, control2, end)
         return path
+
+    def intersects_line(self, point1: QPointF, point2: QPointF) -> bool:
+        """
+        Checks whether a line segment intersects with this edge.
+
+        The line segment is intersected analytically with the cubic Bézier curve, which avoids
+        flattening the curve into a polygon.
+
+        Parameters
+        ----------
+        point1 : QPointF
+            Line segment starting point
+        point2 : QPointF
+            Line segment end point
+
+        Returns
+        -------
+        bool
+            Whether the line segment intersects the edge
+        """
+        return _segment_intersects_cubic(point1, point2, *self.control_points())
+
+
+def _segment_intersects_segment(p0: QPointF, p1: QPointF, q0: QPointF, q1: QPointF) -> bool:
+    """
+    Check whether two line segments intersect using cross products.
+
+    Parameters
+    ----------
+    p0 : QPointF
+        First segment starting point
+    p1 : QPointF
+        First segment end point
+    q0 : QPointF
+        Second segment starting point
+    q1 : QPointF
+        Second segment end point
+
+    Returns
+    -------
+    bool
+        Whether the two line segments intersect
+    """
+    rx, ry = p1.x() - p0.x(), p1.y() - p0.y()
+    sx, sy = q1.x() - q0.x(), q1.y() - q0.y()
+    qpx, qpy = q0.x() - p0.x(), q0.y() - p0.y()
+    denominator = rx * sy - ry * sx
+
+    # Parallel segments only intersect if they are collinear and overlap
+    if denominator == 0:
+        if qpx * ry - qpy * rx != 0:
+            return False
+        length = rx * rx + ry * ry
+        if length == 0:
+            return qpx == 0 and qpy == 0
+        t0 = (qpx * rx + qpy * ry) / length
+        t1 = t0 + (sx * rx + sy * ry) / length
+        return min(t0, t1) <= 1 and max(t0, t1) >= 0
+
+    # Calculate the intersection parameter along both segments
+    t = (qpx * sy - qpy * sx) / denominator
+    u = (qpx * ry - qpy * rx) / denominator
+    return 0 <= t <= 1 and 0 <= u <= 1
+
+
+def _segment_intersects_cubic(p0: QPointF, p1: QPointF, c0: QPointF, c1: QPointF, c2: QPointF,
+                              c3: QPointF) -> bool:
+    """
+    Check whether a line segment intersects a cubic Bézier curve.
+
+    The implicit line equation ``ax + by + c = 0`` of the segment is substituted into the
+    parametric form of the curve, which results in a cubic in ``t``. Each root in ``[0, 1]`` is a
+    point on the curve that lies on the line, which is then checked to lie on the segment.
+
+    Parameters
+    ----------
+    p0 : QPointF
+        Line segment starting point
+    p1 : QPointF
+        Line segment end point
+    c0 : QPointF
+        Curve starting point
+    c1 : QPointF
+        Curve first control point
+    c2 : QPointF
+        Curve second control point
+    c3 : QPointF
+        Curve end point
+
+    Returns
+    -------
+    bool
+        Whether the line segment intersects the curve
+    """
+    x0, y0, x1, y1 = p0.x(), p0.y(), p1.x(), p1.y()
+    xs = (c0.x(), c1.x(), c2.x(), c3.x())
+    ys = (c0.y(), c1.y(), c2.y(), c3.y())
+
+    # The curve lies within the bounding box of its control points
+    if (max(x0, x1) < min(xs) or min(x0, x1) > max(xs) or
+            max(y0, y1) < min(ys) or min(y0, y1) > max(ys)):
+        return False
+
+    # Get the implicit line equation of the segment (degenerate segments cannot intersect)
+    line_a, line_b = y1 - y0, x0 - x1
+    line_c = x1 * y0 - x0 * y1
+    length = line_a * line_a + line_b * line_b
+    if length == 0:
+        return False
+
+    # Get the polynomial coefficients of the curve and substitute them into the line equation
+    coefficients = []
+    for v0, v1, v2, v3 in (xs, ys):
+        coefficients.append((-v0 + 3 * v1 - 3 * v2 + v3, 3 * v0 - 6 * v1 + 3 * v2,
+                             -3 * v0 + 3 * v1, v0))
+    (ax, bx, cx, dx), (ay, by, cy, dy) = coefficients
+    roots = _solve_cubic(line_a * ax + line_b * ay, line_a * bx + line_b * by,
+                         line_a * cx + line_b * cy, line_a * dx + line_b * dy + line_c)
+
+    # Check if any of the points on the curve also lie within the segment
+    for t in roots:
+        if not -1e-9 <= t <= 1 + 1e-9:
+            continue
+        x = ((ax * t + bx) * t + cx) * t + dx
+        y = ((ay * t + by) * t + cy) * t + dy
+        s = ((x - x0) * (x1 - x0) + (y - y0) * (y1 - y0)) / length
+        if -1e-9 <= s <= 1 + 1e-9:
+            return True
+    return False
+
+
+def _solve_cubic(a: float, b: float, c: float, d: float) -> list[float]:
+    """
+    Find the real roots of the polynomial ``at^3 + bt^2 + ct + d``.
+
+    Lower order polynomials are solved directly if the leading coefficients are zero.
+
+    Parameters
+    ----------
+    a : float
+        Cubic coefficient
+    b : float
+        Quadratic coefficient
+    c : float
+        Linear coefficient
+    d : float
+        Constant coefficient
+
+    Returns
+    -------
+    list[float]
+        Real roots of the polynomial
+    """
+    scale = max(abs(a), abs(b), abs(c), abs(d))
+    if scale == 0:
+        return []
+
+    # Solve as a quadratic or linear equation if the leading coefficient(s) vanish
+    if abs(a) <= 1e-12 * scale:
+        if abs(b) <= 1e-12 * scale:
+            if abs(c) <= 1e-12 * scale:
+                return []
+            return [-d / c]
+        discriminant = c * c - 4 * b * d
+        if discriminant < 0:
+            return []
+        root = sqrt(discriminant)
+        return [(-c + root) / (2 * b), (-c - root) / (2 * b)]
+
+    # Reduce to a depressed cubic x^3 + px + q with t = x - b / 3a
+    b, c, d = b / a, c / a, d / a
+    offset = -b / 3
+    p = c - b * b / 3
+    q = 2 * b * b * b / 27 - b * c / 3 + d
+    discriminant = q * q / 4 + p * p * p / 27
+
+    # One real root (Cardano's formula)
+    if discriminant > 0:
+        root = sqrt(discriminant)
+        u, v = -q / 2 + root, -q / 2 - root
+        return [copysign(abs(u) ** (1 / 3), u) + copysign(abs(v) ** (1 / 3), v) + offset]
+
+    # Repeated real roots
+    if discriminant == 0:
+        u = copysign(abs(q / 2) ** (1 / 3), -q)
+        return [2 * u + offset, -u + offset]
+
+    # Three real roots (trigonometric method)
+    radius = sqrt(-p / 3)
+    phi = acos(max(-1.0, min(1.0, -q / (2 * radius * radius * radius))))
+    return [2 * radius * cos((phi + 2 * pi * k) / 3) + offset for k in range(3)]
@@ -2,13 +2,13 @@
 Module containing extension of QGraphicsProxyWidget representing node entries..
 """
 # pylint: disable = no-name-in-module
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional
 
 from PyQt5.QtWidgets import QGraphicsProxyWidget, QGraphicsSceneHoverEvent
-from PyQt5.QtCore import QPoint
+from PyQt5.QtCore import QEvent
 from PyQt5.QtGui import QEnterEvent
 
-from QNodeEditor.widgets.value_box import ValueBox
 if TYPE_CHECKING:
     from QNodeEditor.entry import Entry
 
@@ -30,6 +30,7 @@ class EntryGraphics(QGraphicsProxyWidget):
         super().__init__(*args, **kwargs)
         self.entry: 'Entry' = entry
         self.setAcceptHoverEvents(True)
+        self._hovered: bool = False
 
     def hoverEnterEvent(self, event: Optional[QGraphicsSceneHoverEvent]) -> None:
         """
@@ -46,11 +47,18 @@ class EntryGraphics(QGraphicsProxyWidget):
 
         :meta private:
         """
+        # Only forward the event if the hover state changed
+        if self._hovered:
+            return super().hoverEnterEvent(event)
+        self._hovered = True
+
+        # Only construct the enter event if the widget handles it
         widget = self.widget()
-        local_pos = widget.mapFromGlobal(event.pos().toPoint())
-        screen_pos = event.screenPos()
-        window_pos = widget.mapToParent(event.pos().toPoint())
-        widget.enterEvent(QEnterEvent(local_pos, window_pos, screen_pos))
+        if widget is not None and _overrides_handler(type(widget), 'enterEvent'):
+            local_pos = widget.mapFromGlobal(event.pos().toPoint())
+            screen_pos = event.screenPos()
+            window_pos = widget.mapToParent(event.pos().toPoint())
+            widget.enterEvent(QEnterEvent(local_pos, window_pos, screen_pos))
         return super().hoverEnterEvent(event)
 
     def hoverLeaveEvent(self, event: Optional[QGraphicsSceneHoverEvent]) -> None:
@@ -68,9 +76,35 @@ class EntryGraphics(QGraphicsProxyWidget):
 
         :meta private:
         """
+        self._hovered = False
+
+        # Only construct the leave event if the widget handles it
         widget = self.widget()
-        local_pos = widget.mapFromGlobal(event.pos().toPoint())
-        screen_pos = event.screenPos()
-        window_pos = widget.mapToParent(event.pos().toPoint())
-        widget.leaveEvent(QEnterEvent(local_pos, window_pos, screen_pos))
-        return super().hoverEnterEvent(event)
\ No newline at end of file
+        if widget is not None and _overrides_handler(type(widget), 'leaveEvent'):
+            widget.leaveEvent(QEvent(QEvent.Leave))
+        return super().hoverLeaveEvent(event)
+
+
+@lru_cache(maxsize=None)
+def _overrides_handler(widget_class: type, name: str) -> bool:
+    """
+    Check whether a widget class overrides an event handler in Python.
+
+    Parameters
+    ----------
+    widget_class : type
+        Class of the widget to check
+    name : str
+        Name of the event handler (such as ``'enterEvent'``)
+
+    Returns
+    -------
+    bool
+        Whether a class in the hierarchy defined outside of PyQt5 implements the handler
+    """
+    for cls in widget_class.__mro__:
+        if cls.__module__.startswith('PyQt5'):
+            return False
+        if name in vars(cls):
+            return True
+    return False
\ No newline at end of file
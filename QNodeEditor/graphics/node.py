@@ -2,16 +2,21 @@
 Module containing extension of QGraphicsItem representing a node.
 """
 # pylint: disable = no-name-in-module, C0103
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from math import ceil
+from typing import TYPE_CHECKING, Optional
 
-from PyQt5.QtWidgets import QGraphicsItem, QGraphicsDropShadowEffect, QGraphicsTextItem
+from PyQt5.QtWidgets import (QGraphicsItem, QGraphicsTextItem, QGraphicsScene, QGraphicsPixmapItem,
+                             QGraphicsBlurEffect, QGraphicsPathItem)
 from PyQt5.QtCore import QRectF, Qt, QPointF, QVariant
-from PyQt5.QtGui import QPainter, QPainterPath, QColor, QBrush, QPen, QFontMetrics
+from PyQt5.QtGui import (QPainter, QPainterPath, QColor, QBrush, QPen, QFontMetrics, QPixmap,
+                         QImage, QFont)
 
 from QNodeEditor.themes import ThemeType, DarkTheme
 if TYPE_CHECKING:
     from QNodeEditor.node import Node
     from QNodeEditor.entry import Entry
+    from QNodeEditor.socket import Socket
 
 
 class NodeGraphics(QGraphicsItem):
@@ -35,9 +40,14 @@ class NodeGraphics(QGraphicsItem):
 
         # Set tracking variables
         self._hovered: bool = False
+        self._batch_move: bool = False
 
         # Set node graphical properties
         self.header_height: float = 24.0
+        self._height: Optional[float] = None
+        self._entry_offsets: dict['Entry', float] = {}
+        self._sockets: Optional[list['Socket']] = None
+        self._bounding_rect: QRectF = QRectF()
         self.width: float = 200
         self.colors: dict[str, QColor] = {
             'body': QColor(57, 57, 57),
@@ -50,19 +60,26 @@ class NodeGraphics(QGraphicsItem):
         # Set node interaction properties
         self.setFlags(QGraphicsItem.ItemIsSelectable | QGraphicsItem.ItemIgnoresParentOpacity |
                       QGraphicsItem.ItemSendsScenePositionChanges | QGraphicsItem.ItemIsMovable)
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.setAcceptHoverEvents(True)
 
-        # Add drop shadow
-        self.shadow_effect: QGraphicsDropShadowEffect = QGraphicsDropShadowEffect()
+        # Add node body, header, and outline (so hovering only needs to restyle the outline)
+        self._body_item: _NodeShapeItem = _NodeShapeItem(self)
+        self._header_item: _NodeShapeItem = _NodeShapeItem(self)
+        self._outline_item: _NodeShapeItem = _NodeShapeItem(self)
+        self._body_item.setPen(QPen(Qt.NoPen))
+        self._header_item.setPen(QPen(Qt.NoPen))
+        self._outline_item.setBrush(QBrush(Qt.NoBrush))
+
+        # Set theme (drop shadow is drawn from a cached pixmap in paint)
         self.theme: ThemeType = theme
-        self.shadow_effect.setBlurRadius(self.theme.node_shadow_radius)
-        self.shadow_effect.setOffset(*self.theme.node_shadow_offset)
-        self.setGraphicsEffect(self.shadow_effect)
 
         # Add node title
         self._title_item: QGraphicsTextItem = QGraphicsTextItem(self)
         self._title_item.setFont(self.theme.font())
         self._title_item.setDefaultTextColor(self.theme.node_color_title)
+        self._title_font: str = self._title_item.font().toString()
+        self._title_widths: dict[str, float] = {}
         self.set_title(self.node.title)
 
     @property
@@ -74,20 +91,51 @@ class NodeGraphics(QGraphicsItem):
 
     @width.setter
     def width(self, new_width: float) -> None:
-        self.prepareGeometryChange()
         self._width = new_width
+        if hasattr(self, '_theme'):
+            self.update_geometry()
 
     @property
     def height(self) -> float:
         """
         Get the height of the node.
+
+        The height is calculated from the node entries once and reused until the node geometry
+        is updated.
+        """
+        if self._height is None:
+            self._calculate_layout()
+        return self._height
+
+    def _calculate_layout(self) -> None:
+        """
+        Calculate the vertical offset of every entry and the resulting node height.
+
+        Returns
+        -------
+            None
         """
-        height = self.header_height + 2 * self.theme.node_padding[1]
+        padding_y, spacing = self.theme.node_padding[1], self.theme.node_entry_spacing
+
+        # Accumulate the entry heights (and spacing between entries) below the header
+        y = self.header_height + padding_y
+        self._entry_offsets = {}
+        for entry in self.node.entries:
+            self._entry_offsets[entry] = y
+            y += entry.graphics.rect().height() + spacing
         if len(self.node.entries) > 0:
-            for entry in self.node.entries:
-                height += entry.graphics.rect().height()
-            height += (len(self.node.entries) - 1) * self.theme.node_entry_spacing
-        return height
+            y -= spacing
+        self._height = y + padding_y
+
+    @property
+    def shadow_margin(self) -> int:
+        """
+        Get the distance the drop shadow extends beyond the node outline.
+
+        :meta private:
+        """
+        # The blur spreads out up to twice the blur radius
+        return ceil(2 * self.theme.node_shadow_radius)
 
     @property
     def theme(self) -> ThemeType:
@@ -101,14 +149,22 @@ class NodeGraphics(QGraphicsItem):
     @theme.setter
     def theme(self, new_theme: ThemeType) -> None:
         self._theme = new_theme
-        self.shadow_effect.setBlurRadius(self.theme.node_shadow_radius)
-        self.shadow_effect.setOffset(*self.theme.node_shadow_offset)
-        self.shadow_effect.setColor(self.theme.node_color_shadow)
+        self._body_item.setBrush(QBrush(new_theme.node_color_body))
+        self._header_item.setBrush(QBrush(new_theme.node_color_header))
+
+        # Create outline pens for every node state
+        self._pen_default = QPen(new_theme.node_color_outline_default)
+        self._pen_hovered = QPen(new_theme.node_color_outline_hovered)
+        self._pen_selected = QPen(new_theme.node_color_outline_selected)
+        for pen in (self._pen_default, self._pen_hovered, self._pen_selected):
+            pen.setWidthF(new_theme.node_outline_width)
+        self.update_outline()
         self.update()
 
         # Propagate changed theme to all entries
         for entry in self.node.entries:
             entry.theme = new_theme
+        self.update_geometry()
 
     def set_title(self, title: str) -> None:
         """
@@ -125,14 +181,17 @@ class NodeGraphics(QGraphicsItem):
         -------
             None
         """
-        # Set title (truncate if longer than 80% of width)
-        font_metrics = QFontMetrics(self._title_item.font())
-        elided_text = font_metrics.elidedText(title, Qt.TextElideMode.ElideMiddle,
-                                              int(0.9 * self.width))
+        # Set title (truncate if longer than 90% of width)
+        elided_text = _elide_text(self._title_font, title, int(0.9 * self.width))
         self._title_item.setPlainText(elided_text)
 
+        # Measure the title once for every distinct text
+        text_width = self._title_widths.get(elided_text)
+        if text_width is None:
+            text_width = self._title_item.boundingRect().width()
+            self._title_widths[elided_text] = text_width
+
         # Center title item in node header
-        text_width = self._title_item.boundingRect().width()
         offset = self.width // 2 - text_width // 2
         self._title_item.setPos(offset, 0)
 
@@ -150,13 +209,12 @@ class NodeGraphics(QGraphicsItem):
         tuple[QPointF, float]
             Top-left position and available width for the given entry.
         """
-        # Get the index of the entry in the node entries
-        idx = self.node.entries.index(entry)
-
-        # Calculate the y-location
-        y = self.header_height + self.theme.node_padding[1] + idx * self.theme.node_entry_spacing
-        for i in range(idx):
-            y += self.node.entries[i].graphics.rect().height()
+        # Look up the y-location calculated with the node height
+        if self._height is None:
+            self._calculate_layout()
+        y = self._entry_offsets.get(entry)
+        if y is None:
+            raise ValueError(f'Entry "{entry.name}" is not part of this node')
         return QPointF(0, y), self.width
 
     def hoverEnterEvent(self, _) -> None:
@@ -170,7 +228,7 @@ class NodeGraphics(QGraphicsItem):
         :meta private:
         """
         self._hovered = True
-        self.update()
+        self.update_outline()
 
     def hoverLeaveEvent(self, _) -> None:
         """
@@ -183,7 +241,7 @@ class NodeGraphics(QGraphicsItem):
         :meta private:
         """
         self._hovered = False
-        self.update()
+        self.update_outline()
 
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value: QVariant) -> QVariant:
         """
@@ -203,15 +261,136 @@ class NodeGraphics(QGraphicsItem):
 
         :meta private:
         """
-        # If the node is moving/was moved, update the edges with the new socket positions
-        if change in (QGraphicsItem.ItemPositionChange, QGraphicsItem.ItemTransformChange,
-                      QGraphicsItem.ItemPositionHasChanged):
-            for socket in self.node.sockets():
-                socket.update_edges()
+        # If the node was moved, update the edges with the new socket positions (only once the
+        # position is final, not also when it is about to change). During a batch move, the edges
+        # are updated by the caller after all nodes were moved.
+        if change in (QGraphicsItem.ItemPositionHasChanged, QGraphicsItem.ItemTransformHasChanged):
+            for socket in self.sockets():
+                socket.graphics.invalidate_scene_position()
+                if not self._batch_move:
+                    socket.update_edges()
+
+        # If the node was (de)selected, restyle the outline
+        elif change == QGraphicsItem.ItemSelectedHasChanged:
+            self.update_outline()
 
         # Use the default item change event handler
         return super().itemChange(change, value)
 
+    def batch_move_by(self, dx: float, dy: float) -> None:
+        """
+        Move the node without updating the edges connected to it.
+
+        Used when moving multiple nodes at once, so that edges between them are only updated once
+        after all nodes were moved.
+
+        Parameters
+        ----------
+        dx : float
+            Horizontal distance to move the node by
+        dy : float
+            Vertical distance to move the node by
+
+        Returns
+        -------
+            None
+
+        :meta private:
+        """
+        self._batch_move = True
+        self.moveBy(dx, dy)
+        self._batch_move = False
+
+    def update_outline(self) -> None:
+        """
+        Set the outline pen based on whether the node is selected or hovered.
+
+        Returns
+        -------
+            None
+
+        :meta private:
+        """
+        if self.isSelected():
+            self._outline_item.setPen(self._pen_selected)
+        elif self._hovered:
+            self._outline_item.setPen(self._pen_hovered)
+        else:
+            self._outline_item.setPen(self._pen_default)
+
+    def sockets(self) -> list['Socket']:
+        """
+        Get the sockets of the node, re-using the stored list until sockets are added or removed.
+
+        Returns
+        -------
+        list[:py:class:`~.socket.Socket`]
+            List of all sockets in the node
+
+        :meta private:
+        """
+        if self._sockets is None:
+            self._sockets = self.node.sockets()
+        return self._sockets
+
+    def invalidate_sockets(self) -> None:
+        """
+        Discard the stored list of node sockets after sockets were added or removed.
+
+        Returns
+        -------
+            None
+
+        :meta private:
+        """
+        self._sockets = None
+
+    def update_geometry(self) -> None:
+        """
+        Recalculate the bounding rectangle and drawing geometry of the node after its size or
+        theme changed.
+
+        Returns
+        -------
+            None
+
+        :meta private:
+        """
+        self.prepareGeometryChange()
+        self._height = None
+        self.invalidate_sockets()
+        width, height, header_height = self.width, self.height, self.header_height
+        radius = self.theme.node_border_radius
+
+        # Create node body (rounded rect below title bar with filled top corners)
+        path_body = QPainterPath()
+        path_body.setFillRule(Qt.WindingFill)
+        path_body.addRoundedRect(QRectF(0, header_height, width, height - header_height),
+                                 radius, radius)
+        path_body.addRect(QRectF(0, header_height, radius, radius))
+        path_body.addRect(QRectF(width - radius, header_height, radius, radius))
+        self._body_item.setPath(path_body)
+
+        # Create node header (rounded rect above body with filled bottom corners)
+        path_header = QPainterPath()
+        path_header.setFillRule(Qt.WindingFill)
+        path_header.addRoundedRect(QRectF(0, 0, width, header_height), radius, radius)
+        path_header.addRect(QRectF(0, header_height - radius, radius, radius))
+        path_header.addRect(QRectF(width - radius, header_height - radius, radius, radius))
+        self._header_item.setPath(path_header)
+
+        # Create node outline (rounded rectangle around header and body)
+        rect = QRectF(0, 0, width, height).normalized()
+        path_outline = QPainterPath()
+        path_outline.addRoundedRect(rect, radius, radius)
+        self._outline_item.setPath(path_outline)
+
+        # Include the area covered by the drop shadow
+        margin = self.shadow_margin
+        shadow_rect = rect.translated(*self.theme.node_shadow_offset)
+        self._bounding_rect = rect.united(shadow_rect.adjusted(-margin, -margin, margin, margin))
+        self.update()
+
     def boundingRect(self) -> QRectF:
         """
         Get the bounding rectangle of the node.
@@ -223,11 +402,51 @@ class NodeGraphics(QGraphicsItem):
 
         :meta private:
         """
-        return QRectF(0, 0, self.width, self.height).normalized()
+        return self._bounding_rect
+
+    def shape(self) -> QPainterPath:
+        """
+        Get the shape of the node (excluding the drop shadow).
+
+        Returns
+        -------
+        QPainterPath
+            Node shape used for collision detection and selection
+
+        :meta private:
+        """
+        path = QPainterPath()
+        path.addRect(QRectF(0, 0, self.width, self.height).normalized())
+        return path
+
+    def shadow_pixmap(self, height: float) -> QPixmap:
+        """
+        Get a pre-rendered drop shadow pixmap for the current node size and theme.
+
+        Pixmaps are shared between all nodes with the same size and shadow properties, so the
+        blur is only computed once for each combination (see :py:func:`_render_shadow`).
+
+        Parameters
+        ----------
+        height : float
+            Current height of the node
+
+        Returns
+        -------
+        QPixmap
+            Blurred shadow pixmap (padded by the shadow margin on every side)
+
+        :meta private:
+        """
+        return _render_shadow(self.width, height, self.theme.node_shadow_radius,
+                              self.theme.node_border_radius, self.theme.node_color_shadow.rgba())
 
     def paint(self, painter: QPainter, *_) -> None:
         """
-        Draw the node.
+        Draw the node drop shadow.
+
+        The node body, header, and outline are separate child items, so they can be repainted
+        independently.
 
         Parameters
         ----------
@@ -240,53 +459,110 @@ class NodeGraphics(QGraphicsItem):
 
         :meta private:
         """
-        # Create node body (rounded rect below title bar with filled top corners)
-        path_body = QPainterPath()
-        path_body.setFillRule(Qt.WindingFill)
-        path_body.addRoundedRect(QRectF(0, self.header_height, self.width,
-                                        self.height - self.header_height),
-                                 self.theme.node_border_radius, self.theme.node_border_radius)
-        path_body.addRect(QRectF(0, self.header_height,
-                                 self.theme.node_border_radius, self.theme.node_border_radius))
-        path_body.addRect(QRectF(self.width - self.theme.node_border_radius, self.header_height,
-                                 self.theme.node_border_radius, self.theme.node_border_radius))
+        margin = self.shadow_margin
+        offset_x, offset_y = self.theme.node_shadow_offset
+        painter.drawPixmap(QPointF(offset_x - margin, offset_y - margin),
+                           self.shadow_pixmap(self.height))
 
-        # Create node header (rounded rect above body with filled bottom corners)
-        path_header = QPainterPath()
-        path_header.setFillRule(Qt.WindingFill)
-        path_header.addRoundedRect(QRectF(0, 0, self.width, self.header_height),
-                                   self.theme.node_border_radius, self.theme.node_border_radius)
-        path_header.addRect(QRectF(0, self.header_height - self.theme.node_border_radius,
-                                   self.theme.node_border_radius, self.theme.node_border_radius))
-        path_header.addRect(QRectF(self.width - self.theme.node_border_radius,
-                                   self.header_height - self.theme.node_border_radius,
-                                   self.theme.node_border_radius, self.theme.node_border_radius))
 
-        # Create node outline (rounded rectangle around header and body)
-        path_outline = QPainterPath()
-        path_outline.addRoundedRect(QRectF(0, 0, self.width, self.height),
-                                    self.theme.node_border_radius, self.theme.node_border_radius)
+class _NodeShapeItem(QGraphicsPathItem):
+    """
+    Path item drawing part of a node.
 
-        # Create outline pen based on theme
-        if self.isSelected():
-            pen = QPen(self.theme.node_color_outline_selected)
-        elif self._hovered:
-            pen = QPen(self.theme.node_color_outline_hovered)
-        else:
-            pen = QPen(self.theme.node_color_outline_default)
-        pen.setWidthF(self.theme.node_outline_width)
-
-        # Draw node body
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(self.theme.node_color_body))
-        painter.drawPath(path_body)
-
-        # Draw node header
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(self.theme.node_color_header))
-        painter.drawPath(path_header)
-
-        # Draw outline
-        painter.setPen(pen)
-        painter.setBrush(Qt.NoBrush)
-        painter.drawPath(path_outline.simplified())
+    The item has an empty shape so that it never hides the node itself from item lookups (such as
+    :py:meth:`QGraphicsView.itemAt`) or mouse interaction.
+    """
+
+    def shape(self) -> QPainterPath:
+        """
+        Get the (empty) shape of the item.
+
+        Returns
+        -------
+        QPainterPath
+            Empty path
+
+        :meta private:
+        """
+        return QPainterPath()
+
+
+@lru_cache(maxsize=2048)
+def _elide_text(font: str, text: str, width: int) -> str:
+    """
+    Elide text in the middle if it is wider than the available width.
+
+    Results are shared between all nodes, so equal titles are only measured once.
+
+    Parameters
+    ----------
+    font : str
+        Font of the text (as returned by ``QFont.toString()``)
+    text : str
+        Text to elide
+    width : int
+        Available width in pixels
+
+    Returns
+    -------
+    str
+        Elided text
+    """
+    font_object = QFont()
+    font_object.fromString(font)
+    return QFontMetrics(font_object).elidedText(text, Qt.TextElideMode.ElideMiddle, width)
+
+
+@lru_cache(maxsize=64)
+def _render_shadow(width: float, height: float, radius: float, border_radius: float,
+                   color: int) -> QPixmap:
+    """
+    Render a blurred drop shadow pixmap for a node.
+
+    Results are shared between all nodes, and only the most recently used sizes are kept (node
+    heights change when entries are added or removed).
+
+    Parameters
+    ----------
+    width : float
+        Width of the node
+    height : float
+        Height of the node
+    radius : float
+        Blur radius of the shadow
+    border_radius : float
+        Radius of the rounded node corners
+    color : int
+        Shadow color (as returned by ``QColor.rgba()``)
+
+    Returns
+    -------
+    QPixmap
+        Blurred shadow pixmap (padded by the shadow margin on every side)
+    """
+    # Draw the unblurred node silhouette in the shadow color (the blur spreads out up to twice the
+    # blur radius)
+    margin = ceil(2 * radius)
+    size = QRectF(0, 0, width + 2 * margin, height + 2 * margin).toAlignedRect().size()
+    source = QImage(size, QImage.Format_ARGB32_Premultiplied)
+    source.fill(Qt.transparent)
+    painter = QPainter(source)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QBrush(QColor.fromRgba(color)))
+    painter.drawRoundedRect(QRectF(margin, margin, width, height), border_radius, border_radius)
+    painter.end()
+
+    # Blur the silhouette once by rendering it through a blur effect
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(QPixmap.fromImage(source))
+    blur = QGraphicsBlurEffect()
+    blur.setBlurRadius(radius)
+    item.setGraphicsEffect(blur)
+    scene.addItem(item)
+    result = QImage(size, QImage.Format_ARGB32_Premultiplied)
+    result.fill(Qt.transparent)
+    painter = QPainter(result)
+    scene.render(painter, QRectF(result.rect()), QRectF(source.rect()))
+    painter.end()
+    return QPixmap.fromImage(result)
@@ -2,12 +2,11 @@
 Module containing extension of QGraphicsScene for node editor scenes.
 """
 # pylint: disable = no-name-in-module, C0103
-from math import floor, ceil
 from typing import TYPE_CHECKING
 
-from PyQt5.QtWidgets import QGraphicsScene, QWidget
-from PyQt5.QtCore import QRectF, QPoint
-from PyQt5.QtGui import QPainter, QPen
+from PyQt5.QtWidgets import QGraphicsScene, QWidget, QStyleOptionGraphicsItem
+from PyQt5.QtCore import QRectF, QPointF, Qt
+from PyQt5.QtGui import QPainter, QPen, QPixmap
 
 from QNodeEditor.themes import ThemeType, DarkTheme
 if TYPE_CHECKING:
@@ -19,6 +18,9 @@ class NodeSceneGraphics(QGraphicsScene):
     Extension of QGraphicsScene for drawing node scene.
     """
 
+    GRID_TILE_SCALE: int = 4
+    """int: Resolution multiplier of the background grid tile (keeps points sharp when zoomed in)"""
+
     def __init__(self, scene: 'NodeScene', parent: QWidget = None, theme: ThemeType = DarkTheme):
         """
         Create new node scene graphics.
@@ -54,6 +56,7 @@ class NodeSceneGraphics(QGraphicsScene):
         self.setBackgroundBrush(new_theme.editor_color_background)
         self._pen = QPen(new_theme.editor_color_grid)
         self._pen.setWidthF(self.theme.editor_grid_point_size)
+        self._grid_tile = self._create_grid_tile()
 
         # Propagate changed theme to all nodes
         for node in self.scene.nodes:
@@ -63,6 +66,28 @@ class NodeSceneGraphics(QGraphicsScene):
         for edge in self.scene.edges:
             edge.theme = new_theme
 
+    def _create_grid_tile(self) -> QPixmap:
+        """
+        Render a single grid cell (with the grid point in its center) to tile the background with.
+
+        Returns
+        -------
+        QPixmap
+            Grid tile pixmap
+        """
+        spacing = self.theme.editor_grid_spacing
+        tile = QPixmap(spacing * self.GRID_TILE_SCALE, spacing * self.GRID_TILE_SCALE)
+        tile.setDevicePixelRatio(self.GRID_TILE_SCALE)
+        tile.fill(Qt.transparent)
+
+        # Draw grid point
+        painter = QPainter(tile)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._pen)
+        painter.drawPoint(QPointF(spacing / 2, spacing / 2))
+        painter.end()
+        return tile
+
     def set_size(self, width: int or float, height: int or float) -> None:
         """
         Set the size of the scene.
@@ -97,21 +122,19 @@ class NodeSceneGraphics(QGraphicsScene):
 
         :meta private:
         """
+        # The view's render hints are not applied when drawing into its background cache, so set
+        # the ones the background relies on here
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
         super().drawBackground(painter, rect)
 
-        # Calculate values for ease of use
-        left, right = floor(rect.left()), ceil(rect.right())
-        top, bottom = floor(rect.top()), ceil(rect.bottom())
-
-        # Create grid points
-        grid_points: list[QPoint] = []
-        for x in range(left - (left % self.theme.editor_grid_spacing),
-                       right, self.theme.editor_grid_spacing):
-            for y in range(top - (top % self.theme.editor_grid_spacing),
-                           bottom, self.theme.editor_grid_spacing):
-                grid_points.append(QPoint(x, y))
-
-        # Draw grid points
-        if len(grid_points) > 0:
-            painter.setPen(self._pen)
-            painter.drawPoints(grid_points)
+        # Skip the grid if the points would be smaller than half a pixel
+        level_of_detail = QStyleOptionGraphicsItem.levelOfDetailFromTransform(
+            painter.worldTransform())
+        if level_of_detail * self.theme.editor_grid_point_size < 0.5:
+            return
+
+        # Tile the grid over the area (tiles are centered on the grid points)
+        spacing = self.theme.editor_grid_spacing
+        offset = QPointF((rect.left() + spacing / 2) % spacing,
+                         (rect.top() + spacing / 2) % spacing)
+        painter.drawTiledPixmap(rect, self._grid_tile, offset)
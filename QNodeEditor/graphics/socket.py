@@ -2,7 +2,7 @@
 Module containing extension of QGraphicsItem representing a socket.
 """
 # pylint: disable = no-name-in-module, C0103
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from PyQt5.QtWidgets import QGraphicsItem
 from PyQt5.QtCore import QRectF, QPointF
@@ -32,10 +32,14 @@ class SocketGraphics(QGraphicsItem):
         super().__init__(socket.entry.graphics)
         self.socket: Socket = socket
         self.setFlags(QGraphicsItem.ItemIgnoresParentOpacity)
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
         # Create pen and brush
         self._pen: QPen = QPen()
         self._brush: QBrush = QBrush(QColor(0, 0, 0))
+        self._bounding_rect: QRectF = QRectF()
+        self._ellipse_rect: QRectF = QRectF()
+        self._scene_position: Optional[QPointF] = None
         self.theme: ThemeType = theme
 
     @property
@@ -47,6 +51,7 @@ class SocketGraphics(QGraphicsItem):
 
     @theme.setter
     def theme(self, new_theme: ThemeType) -> None:
+        self.prepareGeometryChange()
         self._theme = new_theme
 
         # Set socket colors and outline
@@ -54,6 +59,13 @@ class SocketGraphics(QGraphicsItem):
         self._brush.setColor(self.theme.socket_color_fill)
         self._pen.setWidthF(self.theme.socket_outline_width)
 
+        # Calculate socket geometry
+        radius = new_theme.socket_radius
+        size = radius + new_theme.socket_outline_width
+        self._bounding_rect = QRectF(-size, -size, 2 * size, 2 * size)
+        self._ellipse_rect = QRectF(-radius, -radius, 2 * radius, 2 * radius)
+        self.update()
+
     def update_position(self) -> None:
         """
         Update the position of the socket relative to the entry it is in.
@@ -62,27 +74,43 @@ class SocketGraphics(QGraphicsItem):
         -------
             None
         """
-        # Determine x-location
-        if (self.socket.entry.node is None or
-                self.socket.entry.entry_type == self.socket.entry.TYPE_INPUT):
-            x = 0.0
-        else:
-            x = self.socket.entry.node.graphics.width
+        # Determine x-location (left edge for inputs, right edge for outputs)
+        entry = self.socket.entry
+        node = entry.node
+        x = 0.0 if node is None or entry.entry_type == entry.TYPE_INPUT else node.graphics.width
 
-        # Determine y-location
-        y = self.socket.entry.widget.height() / 2
-        self.setPos(x, y)
+        # Place socket at the vertical center of the entry
+        self.setPos(x, entry.widget.height() / 2)
+        self._scene_position = None
 
     def get_scene_position(self) -> QPointF:
         """
         Get the position of this socket in scene coordinates.
 
+        The position is calculated once and reused until the socket, its entry, or its node moves.
+        The returned point is shared, so it should not be modified in place.
+
         Returns
         -------
         QPointF
             Scene position of this socket
         """
-        return self.pos() + self.socket.entry.graphics.pos() + self.socket.entry.node.graphics.pos()
+        if self._scene_position is None:
+            entry = self.socket.entry
+            self._scene_position = self.pos() + entry.graphics.pos() + entry.node.graphics.pos()
+        return self._scene_position
+
+    def invalidate_scene_position(self) -> None:
+        """
+        Discard the stored scene position after the socket, its entry, or its node moved.
+
+        Returns
+        -------
+            None
+
+        :meta private:
+        """
+        self._scene_position = None
 
     def boundingRect(self) -> QRectF:
         """
@@ -95,12 +123,7 @@ class SocketGraphics(QGraphicsItem):
 
         :meta private:
         """
-        return QRectF(
-            -1 * (self.theme.socket_radius + self.theme.socket_outline_width),
-            -1 * (self.theme.socket_radius + self.theme.socket_outline_width),
-            2 * (self.theme.socket_radius + self.theme.socket_outline_width),
-            2 * (self.theme.socket_radius + self.theme.socket_outline_width)
-        )
+        return self._bounding_rect
 
     def paint(self, painter: QPainter, *_) -> None:
         """
@@ -119,5 +142,4 @@ class SocketGraphics(QGraphicsItem):
         """
         painter.setBrush(self._brush)
         painter.setPen(self._pen)
-        painter.drawEllipse(-self.theme.socket_radius, -self.theme.socket_radius,
-                            2 * self.theme.socket_radius, 2 * self.theme.socket_radius)
+        painter.drawEllipse(self._ellipse_rect)
@@ -2,13 +2,17 @@
 Module containing extension of QGraphicsView for node editor.
 """
 # pylint: disable = no-name-in-module, C0103
-from typing import Optional, Type, Iterable
-from math import sqrt
+from time import monotonic_ns
+from typing import Optional, Type, Iterable, Callable, Any
+from math import hypot, floor
 from functools import partial
+from operator import methodcaller
 
-from PyQt5.QtWidgets import QGraphicsView, QGraphicsItem, QMenu, QAction, QFrame
-from PyQt5.QtCore import Qt, QPoint, QRectF
-from PyQt5.QtGui import QPainter, QMouseEvent, QWheelEvent, QKeyEvent, QCursor, QContextMenuEvent
+from PyQt5.QtWidgets import (QGraphicsView, QGraphicsItem, QMenu, QAction, QFrame,
+                             QOpenGLWidget)
+from PyQt5.QtCore import Qt, QPoint, QPointF, QRectF, QTimer
+from PyQt5.QtGui import (QPainter, QMouseEvent, QWheelEvent, QKeyEvent, QCursor,
+                         QContextMenuEvent, QSurfaceFormat)
 
 from QNodeEditor.node import Node
 from QNodeEditor.edge import Edge
@@ -40,7 +44,7 @@ class NodeView(QGraphicsView):
     """int: Placing state (a item or group of items is being placed)"""
 
     def __init__(self, scene_graphics: NodeSceneGraphics, theme: ThemeType = DarkTheme,
-                 allow_multiple_inputs: bool = False):
+                 allow_multiple_inputs: bool = False, use_opengl: bool = False):
         """
         Create a new node view.
 
@@ -53,6 +57,9 @@ class NodeView(QGraphicsView):
         allow_multiple_inputs: bool
             If True, multiple edges can be connected to a single input, otherwise only a single
             edge can be connected to any input.
+        use_opengl: bool
+            If True, the view is painted by the GPU using an OpenGL viewport (the full viewport is
+            then always repainted), otherwise it is painted in software.
         """
         super().__init__(scene_graphics)
         self.scene_graphics: NodeSceneGraphics = scene_graphics
@@ -65,10 +72,22 @@ class NodeView(QGraphicsView):
         self.theme: ThemeType = theme
         self._state: int = self.STATE_DEFAULT
 
-        # Set graphics rendering properties
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
-        self.setRenderHints(QPainter.Antialiasing | QPainter.HighQualityAntialiasing |
-                            QPainter.TextAntialiasing | QPainter.SmoothPixmapTransform)
+        # Use an OpenGL viewport with multisample antialiasing if requested
+        self._use_opengl: bool = use_opengl
+        if use_opengl:
+            opengl_format = QSurfaceFormat()
+            opengl_format.setSamples(4)
+            opengl_viewport = QOpenGLWidget()
+            opengl_viewport.setFormat(opengl_format)
+            self.setViewport(opengl_viewport)
+
+        # Set graphics rendering properties (only repaint changed areas unless dragging, all items
+        # set their own pen and brush, and the background grid is cached)
+        self.set_full_viewport_update(False)
+        self.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing |
+                            QPainter.SmoothPixmapTransform)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState)
+        self.setCacheMode(QGraphicsView.CacheBackground)
 
         # Set viewport properties
         self.setFrameShape(QFrame.NoFrame)
@@ -85,14 +104,45 @@ class NodeView(QGraphicsView):
         self._zoom: int = 10
         self._zoom_speed: float = 1.25
 
+        # Set wheel zoom variables (combine zoom steps of quickly following wheel events)
+        self._pending_zoom: int = 0
+        self._zoom_timer: QTimer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(50)
+        self._zoom_timer.timeout.connect(self.flush_zoom)
+
         # Set dragging tracking variables
         self._drag_edge: Optional[Edge] = None
         self._drag_start: Optional[Socket] = None
         self._snap_radius: float = 15.0
+        self._socket_index: Optional[dict[tuple[int, int],
+                                          list[tuple[float, float, Socket]]]] = None
+        self._hover_cache: Optional[tuple[QPoint, Optional[QGraphicsItem]]] = None
+
+        # Set dragged edge update timer (move the dragged edge at most 60 times per second)
+        self._pending_drag_pos: Optional[QPoint] = None
+        self._drag_timer: QTimer = QTimer(self)
+        self._drag_timer.setInterval(16)
+        self._drag_timer.timeout.connect(self.flush_drag_pos)
+
+        # Set cutting tracking variables
+        self._last_cut_pos: QPoint = QPoint()
 
         # Set placing tracking variables
         self._started_place: bool = False
 
+        # Set mouse move throttling variables (handle at most one move per interval)
+        self._move_interval: int = 8_000_000
+        self._last_move: int = 0
+        self._pending_move: Optional[QMouseEvent] = None
+
+        # Set context menu variables (menus are built when first opened)
+        self._context_menus: Optional[dict[str, QMenu]] = None
+        self._context_actions: dict[str, QAction] = {}
+        self._context_item: Optional[QGraphicsItem] = None
+        self._add_menu_outdated: bool = True
+        self.scene_graphics.scene.available_nodes_changed.connect(self._outdate_add_menu)
+
         # Set other tracking variables
         self.prev_mouse_pos: QPoint = QPoint()
         self._last_left_click: QPoint = QPoint()
@@ -138,6 +188,9 @@ class NodeView(QGraphicsView):
 
         :meta private:
         """
+        # Handle any postponed mouse movement first
+        self.flush_mouse_move()
+
         # Call custom handler for button presses
         if event.button() == Qt.MiddleButton:
             self.middle_mouse_button_press(event)
@@ -162,6 +215,9 @@ class NodeView(QGraphicsView):
 
         :meta private:
         """
+        # Handle any postponed mouse movement first
+        self.flush_mouse_move()
+
         # Call custom handler for button releases
         if event.button() == Qt.MiddleButton:
             self.middle_mouse_button_release(event)
@@ -187,9 +243,64 @@ class NodeView(QGraphicsView):
 
         :meta private:
         """
-        self.mouse_move(event)
+        # Handle plain hovering and edge dragging (which combines movements itself) immediately
+        if ((self._state == self.STATE_DEFAULT and event.buttons() == Qt.NoButton)
+                or self._state == self.STATE_DRAGGING):
+            self._pending_move = None
+            self.mouse_move(event)
+
+        # Otherwise, handle the movement now if enough time passed since the last one
+        else:
+            self.throttle_mouse_move(event)
         super().mouseMoveEvent(event)
 
+    def throttle_mouse_move(self, event: QMouseEvent) -> None:
+        """
+        Handle a mouse movement at most once per throttle interval, postponing it otherwise.
+
+        Parameters
+        ----------
+        event : QMouseEvent
+            Mouse move event
+
+        Returns
+        -------
+            None
+
+        :meta private:
+        """
+        # Handle the movement now if enough time passed since the last one
+        now = monotonic_ns()
+        elapsed = now - self._last_move
+        if elapsed >= self._move_interval:
+            self._pending_move = None
+            self._last_move = now
+            self.mouse_move(event)
+
+        # Otherwise, postpone it (keeping only the most recent movement)
+        else:
+            if self._pending_move is None:
+                QTimer.singleShot((self._move_interval - elapsed) // 1_000_000,
+                                  self.flush_mouse_move)
+            self._pending_move = QMouseEvent(event.type(), event.localPos(), event.windowPos(),
+                                             event.screenPos(), event.button(), event.buttons(),
+                                             event.modifiers())
+
+    def flush_mouse_move(self) -> None:
+        """
+        Handle the most recent postponed mouse movement (if any).
+
+        Returns
+        -------
+            None
+
+        :meta private:
+        """
+        if self._pending_move is not None:
+            event, self._pending_move = self._pending_move, None
+            self._last_move = monotonic_ns()
+            self.mouse_move(event)
+
     def wheelEvent(self, event: QWheelEvent) -> None:
         """
         Handle mouse scrolls.
@@ -205,10 +316,51 @@ class NodeView(QGraphicsView):
 
         :meta private:
         """
+        # Collect the zoom step
         if event.angleDelta().y() > 0:
-            self.zoom_in()
+            self._pending_zoom += 1
         else:
-            self.zoom_out()
+            self._pending_zoom -= 1
+
+        # Zoom immediately at the start of a scroll, and combine the following steps until the
+        # timer runs out
+        if not self._zoom_timer.isActive():
+            self.flush_zoom()
+            self._zoom_timer.start()
+
+    def flush_zoom(self) -> None:
+        """
+        Apply the collected zoom steps of scroll events (if any).
+
+        Returns
+        -------
+            None
+
+        :meta private:
+        """
+        if self._pending_zoom != 0:
+            steps, self._pending_zoom = self._pending_zoom, 0
+            self.zoom_by(steps)
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:
+        """
+        Scroll the view and clear the cached hovered item.
+
+        Parameters
+        ----------
+        dx : int
+            Horizontal scroll distance in pixels
+        dy : int
+            Vertical scroll distance in pixels
+
+        Returns
+        -------
+            None
+
+        :meta private:
+        """
+        self._hover_cache = None
+        super().scrollContentsBy(dx, dy)
 
     def keyPressEvent(self, event: QKeyEvent) -> None:
         """
@@ -293,7 +445,9 @@ class NodeView(QGraphicsView):
 
         :meta private:
         """
-        self._last_left_click = self.mapToScene(event.pos())
+        # Map the click position to the scene and find the clicked item (once for all cases)
+        scene_pos = self.mapToScene(event.pos())
+        self._last_left_click = scene_pos
         clicked_item = self.itemAt(event.pos())
 
         # Start drag if socket is clicked (and in default mode)
@@ -304,7 +458,7 @@ class NodeView(QGraphicsView):
         # End drag if user clicks anywhere while dragging (and connect sockets if applicable)
         if self._state == self.STATE_DRAGGING:
             if not isinstance(clicked_item, SocketGraphics):
-                socket = self.get_drag_socket(event.pos())
+                socket = self.get_drag_socket(event.pos(), scene_pos, clicked_item)
                 if socket is not None:
                     clicked_item = socket.graphics
             self.end_drag(clicked_item)
@@ -324,7 +478,8 @@ class NodeView(QGraphicsView):
         # Start cutting edges if user shift+clicks on empty space
         if (self._state == self.STATE_DEFAULT and event.modifiers() == Qt.ShiftModifier
                 and clicked_item is None):
-            self._cutter.reset(self.mapToScene(event.pos()))
+            self._cutter.reset(scene_pos)
+            self._last_cut_pos = event.pos()
             self._state = self.STATE_CUTTING
             return event.accept()
 
@@ -382,12 +537,12 @@ class NodeView(QGraphicsView):
 
         :meta private:
         """
-        released_item = self.itemAt(event.pos())
-
         # End drag if mouse was moved by enough
-        if self._state == self.STATE_DRAGGING and self.mouse_dragged(self.mapToScene(event.pos())):
+        scene_pos = self.mapToScene(event.pos())
+        if self._state == self.STATE_DRAGGING and self.mouse_dragged(scene_pos):
+            released_item = self.itemAt(event.pos())
             if not isinstance(released_item, SocketGraphics):
-                socket = self.get_drag_socket(event.pos())
+                socket = self.get_drag_socket(event.pos(), scene_pos, released_item)
                 if socket is not None:
                     released_item = socket.graphics
             self.end_drag(released_item)
@@ -478,6 +633,11 @@ class NodeView(QGraphicsView):
 
         :meta private:
         """
+        # Only track the mouse position when hovering without any action taking place
+        if self._state == self.STATE_DEFAULT and event.buttons() == Qt.NoButton:
+            self.prev_mouse_pos = event.pos()
+            return
+
         # Calculate mouse position change
         offset = self.prev_mouse_pos - event.pos()
         self.prev_mouse_pos = event.pos()
@@ -493,17 +653,22 @@ class NodeView(QGraphicsView):
         if self._state == self.STATE_DRAGGING:
             if self._drag_edge.graphics is None:
                 self._state = self.STATE_DEFAULT
+                self.set_full_viewport_update(False)
+                self._socket_index = None
+                self._drag_timer.stop()
+                self._pending_drag_pos = None
             else:
-                pos = self.calculate_drag_pos(event.pos())
-                self._drag_edge.graphics.pos_end = pos
+                self._pending_drag_pos = QPoint(event.pos())
 
         # Set placed node position to mouse position
         if self._state == self.STATE_PLACING:
             self.move_selection(self.mapToScene(event.pos()))
 
-        # Add mouse position to cut line
+        # Add mouse position to cut line (if the mouse moved at least two pixels)
         if self._state == self.STATE_CUTTING:
-            self._cutter.add_point(self.mapToScene(event.pos()))
+            if (event.pos() - self._last_cut_pos).manhattanLength() >= 2:
+                self._last_cut_pos = event.pos()
+                self._cutter.add_point(self.mapToScene(event.pos()))
 
     def set_editing_flag(self, editing: bool) -> None:
         """
@@ -523,6 +688,30 @@ class NodeView(QGraphicsView):
         """
         self._editing = editing
 
+    def set_full_viewport_update(self, enabled: bool) -> None:
+        """
+        Switch between repainting the full viewport and repainting only the changed areas.
+
+        The full viewport is only repainted while dragging an edge, when large and quickly changing
+        parts of the scene are redrawn on every mouse move. An OpenGL viewport is always fully
+        repainted, since it does not support partial updates.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to repaint the full viewport on every change
+
+        Returns
+        -------
+            None
+
+        :meta private:
+        """
+        if enabled or self._use_opengl:
+            self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        else:
+            self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+
     def start_drag(self, socket_graphics: SocketGraphics) -> None:
         """
         Start dragging an edge from this socket.
@@ -538,13 +727,18 @@ class NodeView(QGraphicsView):
         :meta private:
         """
         self._state = self.STATE_DRAGGING
+        self.set_full_viewport_update(True)
         self._drag_start = socket_graphics.socket
         self._drag_edge = Edge(scene=self.scene_graphics.scene, theme=self.theme)
 
         # Set both start and end position of dragged edge to the start socket
         pos = self._drag_start.graphics.get_scene_position()
-        self._drag_edge.graphics.pos_start = pos
-        self._drag_edge.graphics.pos_end = pos
+        self._drag_edge.graphics.set_positions(pos, pos)
+
+        # Index the socket positions for snapping (sockets do not move while dragging an edge)
+        self.build_socket_index()
+        self._hover_cache = None
+        self._drag_timer.start()
 
     def end_drag(self, item: QGraphicsItem or None) -> None:
         """
@@ -566,6 +760,11 @@ class NodeView(QGraphicsView):
         """
         # Reset tracking variables
         self._state = self.STATE_DEFAULT
+        self.set_full_viewport_update(False)
+        self._socket_index = None
+        self._hover_cache = None
+        self._drag_timer.stop()
+        self._pending_drag_pos = None
         self._drag_edge.remove()
         self._drag_edge = None
 
@@ -579,10 +778,9 @@ class NodeView(QGraphicsView):
         if item.socket.entry.entry_type == self._drag_start.entry.entry_type:
             return
 
-        # Check if an edge already exists between these two sockets
-        for edge in self.scene_graphics.scene.edges:
-            if ((edge.start == self._drag_start and edge.end == item.socket) or
-                    (edge.end == self._drag_start and edge.start == item.socket)):
+        # Check if an edge already exists between these two sockets (only edges of start socket)
+        for edge in self._drag_start.edges:
+            if edge.start == item.socket or edge.end == item.socket:
                 return
 
         # Remove all present edges from input sockets (only single edge allowed)
@@ -596,6 +794,25 @@ class NodeView(QGraphicsView):
         Edge(self._drag_start, item.socket, self.scene_graphics.scene, self.theme)
         self._drag_start = None
 
+    def flush_drag_pos(self) -> None:
+        """
+        Move the end of the dragged edge to the most recent mouse position (if it changed).
+
+        Called periodically while dragging an edge, so the edge is not updated for every mouse
+        movement.
+
+        Returns
+        -------
+            None
+
+        :meta private:
+        """
+        if self._pending_drag_pos is None or self._drag_edge is None:
+            return
+        if self._drag_edge.graphics is not None:
+            self._drag_edge.graphics.pos_end = self.calculate_drag_pos(self._pending_drag_pos)
+        self._pending_drag_pos = None
+
     def calculate_drag_pos(self, mouse_pos: QPoint) -> QPoint:
         """
         Calculate the end position of the dragged edge based on the mouse location.
@@ -605,7 +822,7 @@ class NodeView(QGraphicsView):
         Parameters
         ----------
         mouse_pos : QPoint
-            Mouse position in scene coordinates
+            Mouse position in view coordinates
 
         Returns
         -------
@@ -614,19 +831,25 @@ class NodeView(QGraphicsView):
 
         :meta private:
         """
-        dragged_socket = self.get_drag_socket(mouse_pos)
+        scene_pos = self.mapToScene(mouse_pos)
+        dragged_socket = self.get_drag_socket(mouse_pos, scene_pos)
         if dragged_socket is not None:
             return dragged_socket.graphics.get_scene_position()
-        return self.mapToScene(mouse_pos)
+        return scene_pos
 
-    def get_drag_socket(self, mouse_pos: QPoint) -> Socket or None:
+    def get_drag_socket(self, mouse_pos: QPoint, scene_pos: Optional[QPointF] = None,
+                        hovered_item: Optional[QGraphicsItem] = None) -> Socket or None:
         """
         Get the socket a dragged edge should connect to.
 
         Parameters
         ----------
         mouse_pos : QPoint
-            Mouse position in global coordinates
+            Mouse position in view coordinates
+        scene_pos : QPointF, optional
+            Mouse position in scene coordinates (mapped from the view position if not provided)
+        hovered_item : QGraphicsItem, optional
+            Item at the mouse position if it is already known (looked up if not provided)
 
         Returns
         -------
@@ -636,19 +859,72 @@ class NodeView(QGraphicsView):
         :meta private:
         """
         # Use nearest socket position if within snap radius
-        socket, dist = self.closest_socket(self.mapToScene(mouse_pos))
+        if scene_pos is None:
+            scene_pos = self.mapToScene(mouse_pos)
+        socket, dist = self.closest_socket(scene_pos, self._snap_radius)
         if dist <= self._snap_radius:
             return socket
 
         # Otherwise, use socket connected to hovered entry
-        hovered_item = self.itemAt(mouse_pos)
+        if hovered_item is None:
+            hovered_item = self.hovered_item(mouse_pos)
         if isinstance(hovered_item, EntryGraphics) and hovered_item.entry.socket is not None:
             return hovered_item.entry.socket
 
         # Otherwise, return None
         return None
 
-    def closest_socket(self, pos: QPoint) -> tuple[Socket, float]:
+    def hovered_item(self, mouse_pos: QPoint) -> Optional[QGraphicsItem]:
+        """
+        Get the item at a position, re-using the previous result if the mouse barely moved.
+
+        This avoids a hit test of the scene for every mouse movement while dragging an edge. The
+        cached result is cleared when a drag starts or ends and when the view scrolls or zooms.
+
+        Parameters
+        ----------
+        mouse_pos : QPoint
+            Mouse position in view coordinates
+
+        Returns
+        -------
+        QGraphicsItem or None
+            Item at the position (or None if there is no item)
+
+        :meta private:
+        """
+        if (self._hover_cache is not None
+                and (mouse_pos - self._hover_cache[0]).manhattanLength() < 2):
+            return self._hover_cache[1]
+        item = self.itemAt(mouse_pos)
+        self._hover_cache = (QPoint(mouse_pos), item)
+        return item
+
+    def build_socket_index(self) -> None:
+        """
+        Sort all sockets in the scene into a grid of cells the size of the snap radius.
+
+        The index lets :py:meth:`closest_socket` only check sockets near a position. Every cell
+        stores the scene coordinates along with the socket, so they do not have to be looked up for
+        every query. It is used while dragging an edge, during which the sockets do not move.
+
+        Returns
+        -------
+            None
+
+        :meta private:
+        """
+        cell_size = self._snap_radius
+        self._socket_index = {}
+        for node in self.scene_graphics.scene.nodes:
+            for socket in node.graphics.sockets():
+                socket_pos = socket.graphics.get_scene_position()
+                x, y = socket_pos.x(), socket_pos.y()
+                cell = (floor(x / cell_size), floor(y / cell_size))
+                self._socket_index.setdefault(cell, []).append((x, y, socket))
+
+    def closest_socket(self, pos: QPoint,
+                       max_distance: Optional[float] = None) -> tuple[Optional[Socket], float]:
         """
         Find the socket closest to a position.
 
@@ -656,26 +932,65 @@ class NodeView(QGraphicsView):
         ----------
         pos : QPoint
             Position to find the closest socket to in scene coordinates
+        max_distance : float, optional
+            Only look for sockets up to this distance away. If the socket index is available, only
+            the sockets in the neighbouring grid cells are checked. Otherwise, only the sockets in
+            the scene area around the position are checked (default: no limit).
 
         Returns
         -------
-        tuple[:py:class:`~QNodeEditor.socket.Socket`, float]
-            The closest socket and its distance from the point
+        tuple[:py:class:`~QNodeEditor.socket.Socket` or None, float]
+            The closest socket and its distance from the point (None and infinity if no socket was
+            found)
 
         :meta private:
         """
-        min_dist = float('inf')
-        min_socket = None
-        px, py = pos.x(), pos.y()
-        for node in self.scene_graphics.scene.nodes:
-            for socket in node.sockets():
-                if socket != self._drag_start:
+        # Get candidate sockets from the neighbouring index cells if possible
+        if (max_distance is not None and self._socket_index is not None
+                and max_distance <= self._snap_radius):
+            cell_x = floor(pos.x() / self._snap_radius)
+            cell_y = floor(pos.y() / self._snap_radius)
+            candidates = [candidate for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                          for candidate in self._socket_index.get((cell_x + dx, cell_y + dy), ())]
+
+        # Otherwise, get candidate sockets in the scene area around the position if possible
+        elif max_distance is not None:
+            search_rect = QRectF(pos.x() - max_distance, pos.y() - max_distance,
+                                 2 * max_distance, 2 * max_distance)
+            candidates = []
+            for item in self.scene_graphics.items(search_rect, Qt.IntersectsItemBoundingRect):
+                if isinstance(item, SocketGraphics):
+                    socket_pos = item.get_scene_position()
+                    candidates.append((socket_pos.x(), socket_pos.y(), item.socket))
+
+        # Otherwise, check all sockets in the scene
+        else:
+            candidates = []
+            for node in self.scene_graphics.scene.nodes:
+                for socket in node.graphics.sockets():
                     socket_pos = socket.graphics.get_scene_position()
-                    sx, sy = socket_pos.x(), socket_pos.y()
-                    dist = sqrt((px - sx) * (px - sx) + (py - sy) * (py - sy))
-                    if dist < min_dist:
-                        min_dist = dist
-                        min_socket = socket
+                    candidates.append((socket_pos.x(), socket_pos.y(), socket))
+
+        # Find the closest candidate (comparing squared distances)
+        min_dist_squared = float('inf')
+        min_dist = float('inf') if max_distance is None else max_distance
+        min_socket = None
+        px, py, drag_start = pos.x(), pos.y(), self._drag_start
+        for sx, sy, socket in candidates:
+            dx, dy = abs(px - sx), abs(py - sy)
+
+            # Skip sockets that are further away along either axis than the closest socket so far
+            if dx > min_dist or dy > min_dist or socket is drag_start:
+                continue
+            dist_squared = dx * dx + dy * dy
+            if dist_squared < min_dist_squared:
+                min_dist_squared = dist_squared
+                min_dist = hypot(dx, dy)
+                min_socket = socket
+
+        # Ignore the closest socket if it is too far away
+        if max_distance is not None and min_dist_squared > max_distance * max_distance:
+            return None, float('inf')
         return min_socket, min_dist
 
     def mouse_dragged(self, release_point: QPoint, button: Qt.MouseButton = Qt.LeftButton,
@@ -702,9 +1017,33 @@ class NodeView(QGraphicsView):
         :meta private:
         """
         press_point = self._last_left_click if button == Qt.LeftButton else self._last_right_click
-        delta = sqrt((press_point.x() - release_point.x()) * (press_point.x() - release_point.x()) +
-                     (press_point.y() - release_point.y()) * (press_point.y() - release_point.y()))
-        return delta >= threshold
+        dx, dy = press_point.x() - release_point.x(), press_point.y() - release_point.y()
+        return dx * dx + dy * dy >= threshold * threshold
+
+    def zoom_by(self, steps: int) -> None:
+        """
+        Zoom in or out by a number of steps with a single scaling of the view.
+
+        The zoom level is limited to the minimum and maximum zoom levels.
+
+        Parameters
+        ----------
+        steps : int
+            Number of steps to zoom in (positive) or out (negative)
+
+        Returns
+        -------
+            None
+        """
+        # Update internal zoom tracker (limited to the minimum and maximum zoom level)
+        new_zoom = min(max(self._zoom + steps, self._zoom_min), self._zoom_max)
+        steps, self._zoom = new_zoom - self._zoom, new_zoom
+
+        # Scale the window to the new zoom level (if it changed)
+        if steps != 0:
+            factor = self._zoom_speed ** steps
+            self.scale(factor, factor)
+            self._hover_cache = None
 
     def zoom_in(self) -> None:
         """
@@ -714,14 +1053,7 @@ class NodeView(QGraphicsView):
         -------
             None
         """
-        # Increase internal zoom tracker
-        self._zoom += 1.0
-
-        # Scale the window to the new zoom level (except when maximum zoom level is reached)
-        if self._zoom > self._zoom_max:
-            self._zoom = self._zoom_max
-        else:
-            self.scale(self._zoom_speed, self._zoom_speed)
+        self.zoom_by(1)
 
     def zoom_out(self) -> None:
         """
@@ -731,14 +1063,7 @@ class NodeView(QGraphicsView):
         -------
             None
         """
-        # Decrease internal zoom tracker
-        self._zoom -= 1.0
-
-        # Scale the window to the new zoom level (except when minimum zoom level is reached)
-        if self._zoom < self._zoom_min:
-            self._zoom = self._zoom_min
-        else:
-            self.scale(1 / self._zoom_speed, 1 / self._zoom_speed)
+        self.zoom_by(-1)
 
     def zoom_reset(self) -> None:
         """
@@ -748,12 +1073,7 @@ class NodeView(QGraphicsView):
         -------
             None
         """
-        if self._zoom > 10:
-            while self._zoom > 10:
-                self.zoom_out()
-        else:
-            while self._zoom < 10:
-                self.zoom_in()
+        self.zoom_by(10 - self._zoom)
 
     def remove_selected(self) -> None:
         """
@@ -763,15 +1083,27 @@ class NodeView(QGraphicsView):
         -------
             None
         """
+        # Sort the selected items by type once, then remove the edges before the nodes
+        edges, nodes = [], []
         for item in self.scene_graphics.selectedItems():
             if isinstance(item, EdgeGraphics):
-                item.edge.remove()
+                edges.append(item.edge)
             elif isinstance(item, NodeGraphics):
-                item.node.remove()
+                nodes.append(item.node)
+        for edge in edges:
+            edge.remove()
+        for node in nodes:
+            node.remove()
+
+        # Sockets of removed nodes can no longer be snapped to
+        self._socket_index = None
 
     def create_context_menu(self, position: QPoint) -> None:
         """
-        Create a context menu at the specified position.
+        Show the context menu for the item at the specified position.
+
+        The context menus are built once and re-used. Only the state of their actions (enabled or
+        disabled) is updated every time a menu is opened.
 
         Parameters
         ----------
@@ -784,30 +1116,97 @@ class NodeView(QGraphicsView):
 
         :meta private:
         """
-        # Create context menu
-        context_menu = QMenu()
+        # Build the context menus the first time one is opened
+        if self._context_menus is None:
+            self._build_context_menus()
 
-        # Add menu actions for clicked item
+        # Pick the menu for the clicked item (and store the item for the menu actions)
         item = self.itemAt(self.mapFromGlobal(position))
         if isinstance(item, NodeGraphics):
-            self._add_node_actions(context_menu, item)
-            context_menu.addSeparator()
-            self._add_align_actions(context_menu)
+            context_menu = self._context_menus['node']
         elif isinstance(item, SocketGraphics):
-            self._add_socket_actions(context_menu, item)
-
-        # Otherwise, add menu and actions for adding nodes, clipboard, and zooming
+            context_menu = self._context_menus['socket']
         else:
-            self._create_add_menu(context_menu)
-            context_menu.addSeparator()
-            self._add_clipboard_actions(context_menu)
-            context_menu.addSeparator()
-            self._add_zoom_actions(context_menu)
-            context_menu.addSeparator()
-            self._add_align_actions(context_menu)
+            context_menu = self._context_menus['scene']
+        self._context_item = item
+
+        # Update the menu actions to the current state of the view
+        self._update_context_menus()
 
         # Show context menu at specified position
         context_menu.exec_(position)
+        self._context_item = None
+
+    def _build_context_menus(self) -> None:
+        """
+        Build the context menus for the scene, nodes, and sockets.
+
+        Returns
+        -------
+            None
+        """
+        self._context_menus = {}
+        self._context_actions = {}
+
+        # Create menu for nodes
+        node_menu = QMenu()
+        self._add_node_actions(node_menu)
+        node_menu.addSeparator()
+        self._add_align_actions(node_menu)
+        self._context_menus['node'] = node_menu
+
+        # Create menu for sockets
+        socket_menu = QMenu()
+        self._add_socket_actions(socket_menu)
+        self._context_menus['socket'] = socket_menu
+
+        # Create menu for the scene with actions for adding nodes, clipboard, and zooming
+        scene_menu = QMenu()
+        self._create_add_menu(scene_menu)
+        scene_menu.addSeparator()
+        self._add_clipboard_actions(scene_menu)
+        scene_menu.addSeparator()
+        self._add_zoom_actions(scene_menu)
+        scene_menu.addSeparator()
+        self._add_align_actions(scene_menu)
+        self._context_menus['scene'] = scene_menu
+
+    def _update_context_menus(self) -> None:
+        """
+        Enable or disable the context menu actions based on the current state of the view.
+
+        Returns
+        -------
+            None
+        """
+        # Rebuild the add menu if the available nodes changed
+        if self._add_menu_outdated:
+            self._fill_add_menu()
+
+        # Disable selection actions if no scene items are selected
+        selected_items = self.scene_graphics.selectedItems()
+        for name in ('duplicate', 'cut', 'copy', 'remove'):
+            self._context_actions[name].setDisabled(len(selected_items) == 0)
+
+        # Disable zoom in/out if limit is reached
+        self._context_actions['zoom_in'].setDisabled(self._zoom >= self._zoom_max)
+        self._context_actions['zoom_out'].setDisabled(self._zoom <= self._zoom_min)
+
+        # Disable alignment and spacing unless multiple nodes are selected (stop at the second)
+        node_items = (item for item in selected_items if isinstance(item, NodeGraphics))
+        multiple_nodes = next(node_items, None) is not None and next(node_items, None) is not None
+        self._context_menus['align'].setDisabled(not multiple_nodes)
+        self._context_menus['spacing'].setDisabled(not multiple_nodes)
+
+    def _outdate_add_menu(self) -> None:
+        """
+        Mark the add menu as outdated, so it is rebuilt the next time a context menu is opened.
+
+        Returns
+        -------
+            None
+        """
+        self._add_menu_outdated = True
 
     def _create_add_menu(self, parent_menu: QMenu) -> None:
         """
@@ -818,6 +1217,20 @@ class NodeView(QGraphicsView):
         parent_menu : QMenu
             Parent menu
 
+        Returns
+        -------
+            None
+        """
+        add_menu = QMenu('Add node', parent_menu)
+        add_menu.triggered.connect(self._add_triggered_node)
+        self._context_menus['add'] = add_menu
+        self._fill_add_menu()
+        parent_menu.addMenu(add_menu)
+
+    def _fill_add_menu(self) -> None:
+        """
+        Fill the add menu with (nested) actions for the available nodes in the scene.
+
         Returns
         -------
             None
@@ -832,17 +1245,39 @@ class NodeView(QGraphicsView):
                     _add_actions(value, sub_menu)
                     menu.addMenu(sub_menu)
 
-                # Create an action for a node class
+                # Create an action for a node class (handled by the add menu triggered signal)
                 else:
-                    action = QAction(key, parent_menu)
-                    action.triggered.connect(partial(self.add_node, value))
+                    action = QAction(key, menu)
+                    action.setData(value)
                     menu.addAction(action)
 
-        # Create QMenu and add nested menus for all available nodes
-        add_menu = QMenu('Add node', parent_menu)
+        # Remove the previous actions and sub-menus
+        add_menu = self._context_menus['add']
+        for sub_menu in add_menu.findChildren(QMenu):
+            sub_menu.deleteLater()
+        add_menu.clear()
+
+        # Add nested menus for all available nodes
         _add_actions(self.scene_graphics.scene.available_nodes, add_menu)
         add_menu.setDisabled(len(self.scene_graphics.scene.available_nodes) == 0)
-        parent_menu.addMenu(add_menu)
+        self._add_menu_outdated = False
+
+    def _add_triggered_node(self, action: QAction) -> None:
+        """
+        Start placing the node of the action that was triggered in the add menu.
+
+        Parameters
+        ----------
+        action : QAction
+            Triggered action (with the node class as data)
+
+        Returns
+        -------
+            None
+        """
+        node_class = action.data()
+        if node_class is not None:
+            self.add_node(node_class)
 
     def _add_clipboard_actions(self, parent_menu: QMenu) -> None:
         """
@@ -871,12 +1306,11 @@ class NodeView(QGraphicsView):
         action_remove.triggered.connect(self.remove_selected)
         action_duplicate.triggered.connect(self.duplicate_selection)
 
-        # Disable actions if no scene items are selected
-        if len(self.scene_graphics.selectedItems()) == 0:
-            action_cut.setDisabled(True)
-            action_copy.setDisabled(True)
-            action_remove.setDisabled(True)
-            action_duplicate.setDisabled(True)
+        # Store the actions that depend on the selection
+        self._context_actions['cut'] = action_cut
+        self._context_actions['copy'] = action_copy
+        self._context_actions['remove'] = action_remove
+        self._context_actions['duplicate'] = action_duplicate
 
         # Add actions to menu
         parent_menu.addAction(action_duplicate)
@@ -908,27 +1342,23 @@ class NodeView(QGraphicsView):
         action_zoom_out.triggered.connect(self.zoom_out)
         action_zoom_reset.triggered.connect(self.zoom_reset)
 
-        # Disable zoom in/out if limit is reached
-        if self._zoom >= self._zoom_max:
-            action_zoom_in.setDisabled(True)
-        if self._zoom <= self._zoom_min:
-            action_zoom_out.setDisabled(True)
+        # Store the actions that depend on the zoom level
+        self._context_actions['zoom_in'] = action_zoom_in
+        self._context_actions['zoom_out'] = action_zoom_out
 
         # Add actions to menu
         parent_menu.addAction(action_zoom_in)
         parent_menu.addAction(action_zoom_out)
         parent_menu.addAction(action_zoom_reset)
 
-    def _add_node_actions(self, parent_menu: QMenu, node_graphics: NodeGraphics) -> None:
+    def _add_node_actions(self, parent_menu: QMenu) -> None:
         """
-        Add a menu with actions that can be performed on a node to a parent menu.
+        Add a menu with actions that can be performed on the clicked node to a parent menu.
 
         Parameters
         ----------
         parent_menu : QMenu
             Parent menu
-        node_graphics : :py:class:`~.node.NodeGraphics`
-            Node graphics the context menu was opened on
 
         Returns
         -------
@@ -939,24 +1369,21 @@ class NodeView(QGraphicsView):
         action_duplicate = QAction('Duplicate node', parent_menu)
 
         # Connect actions to function
-        action_remove.triggered.connect(node_graphics.node.remove)
-        action_duplicate.triggered.connect(partial(self.duplicate_node, node_graphics))
+        action_remove.triggered.connect(self._remove_context_node)
+        action_duplicate.triggered.connect(self._duplicate_context_node)
 
         # Add actions to menu
         parent_menu.addAction(action_remove)
         parent_menu.addAction(action_duplicate)
 
-    @staticmethod
-    def _add_socket_actions(parent_menu: QMenu, socket_graphics: SocketGraphics) -> None:
+    def _add_socket_actions(self, parent_menu: QMenu) -> None:
         """
-        Add a menu with actions that can be performed on a socket to a parent menu.
+        Add a menu with actions that can be performed on the clicked socket to a parent menu.
 
         Parameters
         ----------
         parent_menu : QMenu
             Parent menu
-        socket_graphics : :py:class:`~.socket.SocketGraphics`
-            Socket graphics the context menu was opened on
 
         Returns
         -------
@@ -966,15 +1393,50 @@ class NodeView(QGraphicsView):
         action_disconnect = QAction('Disconnect edges', parent_menu)
 
         # Connect action to function
-        action_disconnect.triggered.connect(socket_graphics.socket.remove_all_edges)
+        action_disconnect.triggered.connect(self._disconnect_context_socket)
 
         # Add action to menu
         parent_menu.addAction(action_disconnect)
 
+    def _remove_context_node(self) -> None:
+        """
+        Remove the node the context menu was opened on.
+
+        Returns
+        -------
+            None
+        """
+        if isinstance(self._context_item, NodeGraphics):
+            self._context_item.node.remove()
+
+    def _duplicate_context_node(self) -> None:
+        """
+        Duplicate the node the context menu was opened on.
+
+        Returns
+        -------
+            None
+        """
+        if isinstance(self._context_item, NodeGraphics):
+            self.duplicate_node(self._context_item)
+
+    def _disconnect_context_socket(self) -> None:
+        """
+        Disconnect all edges from the socket the context menu was opened on.
+
+        Returns
+        -------
+            None
+        """
+        if isinstance(self._context_item, SocketGraphics):
+            self._context_item.socket.remove_all_edges()
+
     def _add_align_actions(self, parent_menu: QMenu) -> None:
         """
         Add a menu with alignment/spacing actions to a parent menu.
 
+        The alignment and spacing menus are created once and shared by all context menus.
+
         Parameters
         ----------
         parent_menu : QMenu
@@ -984,67 +1446,68 @@ class NodeView(QGraphicsView):
         -------
             None
         """
-        # Create actions
-        action_align_horizontal_left = QAction('Horizontal left', parent_menu)
-        action_align_horizontal_center = QAction('Horizontal center', parent_menu)
-        action_align_horizontal_right = QAction('Horizontal right', parent_menu)
-        action_align_vertical_top = QAction('Vertical top', parent_menu)
-        action_align_vertical_center = QAction('Vertical center', parent_menu)
-        action_align_vertical_bottom = QAction('Vertical bottom', parent_menu)
-        action_spacing_equal_vertical = QAction('Equal vertically', parent_menu)
-        action_spacing_equal_horizontal = QAction('Equal horizontally', parent_menu)
-        action_spacing_compress_vertical = QAction('Compress vertically', parent_menu)
-        action_spacing_compress_horizontal = QAction('Compress horizontally', parent_menu)
-
-        # Connect align actions to function
-        action_align_horizontal_left.triggered.connect(partial(self.align_selection,
-                                                               Qt.Horizontal, Qt.AlignLeft))
-        action_align_horizontal_center.triggered.connect(partial(self.align_selection,
-                                                                 Qt.Horizontal, Qt.AlignCenter))
-        action_align_horizontal_right.triggered.connect(partial(self.align_selection,
-                                                                Qt.Horizontal, Qt.AlignRight))
-        action_align_vertical_top.triggered.connect(partial(self.align_selection,
-                                                            Qt.Vertical, Qt.AlignTop))
-        action_align_vertical_center.triggered.connect(partial(self.align_selection,
-                                                               Qt.Vertical, Qt.AlignCenter))
-        action_align_vertical_bottom.triggered.connect(partial(self.align_selection,
-                                                               Qt.Vertical, Qt.AlignBottom))
-
-        # Connect spacing actions to function
-        action_spacing_equal_horizontal.triggered.connect(partial(self.space_selection,
-                                                                  Qt.Horizontal, 'equal'))
-        action_spacing_equal_vertical.triggered.connect(partial(self.space_selection,
-                                                                Qt.Vertical, 'equal'))
-        action_spacing_compress_horizontal.triggered.connect(partial(self.space_selection,
-                                                                     Qt.Horizontal, 'compress'))
-        action_spacing_compress_vertical.triggered.connect(partial(self.space_selection,
-                                                                   Qt.Vertical, 'compress'))
+        # Add existing menus if they were already created
+        if 'align' in self._context_menus:
+            parent_menu.addMenu(self._context_menus['align'])
+            parent_menu.addMenu(self._context_menus['spacing'])
+            return
 
         # Add align actions to menu
         align_menu = QMenu('Align', parent_menu)
-        align_menu.addActions([action_align_horizontal_left,
-                               action_align_horizontal_center,
-                               action_align_horizontal_right])
-        align_menu.addSeparator()
-        align_menu.addActions([action_align_vertical_top,
-                               action_align_vertical_center,
-                               action_align_vertical_bottom])
+        self._add_action_groups(align_menu, self.align_selection, [
+            [('Horizontal left', Qt.Horizontal, Qt.AlignLeft),
+             ('Horizontal center', Qt.Horizontal, Qt.AlignCenter),
+             ('Horizontal right', Qt.Horizontal, Qt.AlignRight)],
+            [('Vertical top', Qt.Vertical, Qt.AlignTop),
+             ('Vertical center', Qt.Vertical, Qt.AlignCenter),
+             ('Vertical bottom', Qt.Vertical, Qt.AlignBottom)]
+        ])
         parent_menu.addMenu(align_menu)
 
         # Add spacing actions to menu
         spacing_menu = QMenu('Spacing', parent_menu)
-        spacing_menu.addActions([action_spacing_equal_horizontal,
-                                 action_spacing_compress_horizontal])
-        spacing_menu.addSeparator()
-        spacing_menu.addActions([action_spacing_equal_vertical,
-                                 action_spacing_compress_vertical])
+        self._add_action_groups(spacing_menu, self.space_selection, [
+            [('Equal horizontally', Qt.Horizontal, 'equal'),
+             ('Compress horizontally', Qt.Horizontal, 'compress')],
+            [('Equal vertically', Qt.Vertical, 'equal'),
+             ('Compress vertically', Qt.Vertical, 'compress')]
+        ])
         parent_menu.addMenu(spacing_menu)
 
-        # Disable actions if no scene items are selected
-        if len([item for item in self.scene_graphics.selectedItems()
-                if isinstance(item, NodeGraphics)]) <= 1:
-            align_menu.setDisabled(True)
-            spacing_menu.setDisabled(True)
+        # Store the menus that depend on the selection
+        self._context_menus['align'] = align_menu
+        self._context_menus['spacing'] = spacing_menu
+
+    @staticmethod
+    def _add_action_groups(menu: QMenu, function: Callable,
+                           groups: list[list[tuple[str, Qt.Orientation, Any]]]) -> None:
+        """
+        Add groups of actions (separated by separators) to a menu.
+
+        Every action calls the function with the axis and option of the action.
+
+        Parameters
+        ----------
+        menu : QMenu
+            Menu to add the actions to
+        function : Callable
+            Function to call with the axis and option when an action is triggered
+        groups : list[list[tuple[str, Qt.Orientation, Any]]]
+            Groups of actions, each a list of (name, axis, option) tuples
+
+        Returns
+        -------
+            None
+        """
+        for i, group in enumerate(groups):
+            if i > 0:
+                menu.addSeparator()
+            actions = []
+            for name, axis, option in group:
+                action = QAction(name, menu)
+                action.triggered.connect(partial(function, axis, option))
+                actions.append(action)
+            menu.addActions(actions)
 
     def add_node(self, node_class: Type[Node]) -> None:
         """
@@ -1068,7 +1531,7 @@ class NodeView(QGraphicsView):
         # Select only the added node and start placing it
         self.scene_graphics.clearSelection()
         node.graphics.setSelected(True)
-        self.move_selection(self.mapToScene(self.mapFromGlobal(QCursor.pos())))
+        self.move_selection(self.cursor_scene_pos())
         self._state = self.STATE_PLACING
 
     def duplicate_node(self, node_graphics: NodeGraphics) -> None:
@@ -1087,16 +1550,28 @@ class NodeView(QGraphicsView):
         :meta private:
         """
         # Create duplicate node to add to the scene
-        duplicate = type(node_graphics.node)()
-        duplicate.set_state(node_graphics.node.get_state())
+        duplicate = node_graphics.node.clone()
         self.scene_graphics.scene.add_node(duplicate)
 
         # Select only the duplicated node and start placing it
         self.scene_graphics.clearSelection()
         duplicate.graphics.setSelected(True)
-        self.move_selection(self.mapToScene(self.mapFromGlobal(QCursor.pos())))
+        self.move_selection(self.cursor_scene_pos())
         self._state = self.STATE_PLACING
 
+    def cursor_scene_pos(self) -> QPointF:
+        """
+        Get the current position of the mouse cursor in scene coordinates.
+
+        Returns
+        -------
+        QPointF
+            Mouse cursor position in scene coordinates
+
+        :meta private:
+        """
+        return self.mapToScene(self.mapFromGlobal(QCursor.pos()))
+
     def move_selection(self, position: QPoint) -> None:
         """
         Move the center point of the selected items to a specified position.
@@ -1113,14 +1588,21 @@ class NodeView(QGraphicsView):
         :meta private:
         """
         # Calculate the coordinate of the center of the selected items
-        bounding_rect = self._get_bounding_rect(self.scene_graphics.selectedItems())
+        items = self._selected_nodes()
+        bounding_rect = self._get_bounding_rect(items)
 
         # Calculate offset and move all items by that much
         offset_x, offset_y = position.x() - bounding_rect.center().x(),\
             position.y() - bounding_rect.center().y()
-        for item in self.scene_graphics.selectedItems():
-            if isinstance(item, NodeGraphics):
-                item.moveBy(offset_x, offset_y)
+
+        # Move all items without per-node edge updates, then update every affected edge once
+        edges = set()
+        for item in items:
+            item.batch_move_by(offset_x, offset_y)
+            for socket in item.sockets():
+                edges.update(socket.edges)
+        for edge in edges:
+            edge.update_positions()
 
     def duplicate_selection(self) -> None:
         """
@@ -1132,18 +1614,10 @@ class NodeView(QGraphicsView):
 
         :meta private:
         """
-        # Check if there are selected nodes
-        selected_nodes = False
-        for item in self.scene_graphics.selectedItems():
-            if isinstance(item, NodeGraphics):
-                selected_nodes = True
-        if not selected_nodes:
+        # Duplicate selection (if there are selected nodes) and start placing it
+        if not self.scene_graphics.scene.clipboard.duplicate_selected():
             return
-
-        # Duplicate selection and start placing it
-        selected_state = self.scene_graphics.scene.clipboard.get_selected_state()
-        self.scene_graphics.scene.clipboard.add_state(selected_state)
-        self.move_selection(self.mapToScene(self.mapFromGlobal(QCursor.pos())))
+        self.move_selection(self.cursor_scene_pos())
         self._state = self.STATE_PLACING
 
     def align_selection(self, axis: Qt.Orientation = Qt.Horizontal,
@@ -1175,45 +1649,44 @@ class NodeView(QGraphicsView):
             direction = Qt.AlignCenter
 
         # Ensure there are enough items to align
-        items = [item for item in self.scene_graphics.selectedItems()
-                 if isinstance(item, NodeGraphics)]
+        items = self._selected_nodes()
         if len(items) == 0:
             raise ValueError('No nodes selected, cannot align')
 
         # Find the limits of the item positions and calculate the center point
         bounding_rect = self._get_bounding_rect(items)
 
-        # Set the position of the items based on the specified settings
-        for item in items:
-            if isinstance(item, NodeGraphics):
-                # Horizontal alignment
-                if axis == Qt.Horizontal and direction == Qt.AlignLeft:
-                    item.setX(bounding_rect.left())
-                elif axis == Qt.Horizontal and direction == Qt.AlignCenter:
-                    item.setX(bounding_rect.center().x() - item.width / 2)
-                elif axis == Qt.Horizontal and direction == Qt.AlignRight:
-                    item.setX(bounding_rect.right() - item.width)
-
-                # Vertical alignment
-                elif axis == Qt.Vertical and direction == Qt.AlignTop:
-                    item.setY(bounding_rect.top())
-                elif axis == Qt.Vertical and direction == Qt.AlignCenter:
-                    item.setY(bounding_rect.center().y() - item.height / 2)
-                elif axis == Qt.Vertical and direction == Qt.AlignBottom:
-                    item.setY(bounding_rect.bottom() - item.height)
-
-                # Incorrect combination of axis and direction
-                else:
-                    directions = {
-                        Qt.AlignLeft: 'Left',
-                        Qt.AlignRight: 'Right',
-                        Qt.AlignTop: 'Top',
-                        Qt.AlignBottom: 'Bottom',
-                        Qt.AlignCenter: ' Center'
-                    }
-                    str_axis = 'Horizontal' if axis == Qt.Horizontal else 'Vertical'
-                    str_dir = directions[direction]
-                    raise ValueError(f"Cannot align '{str_dir}' in axis '{str_axis}'")
+        # Determine the aligned coordinate and which part of the node to align (once for all items)
+        alignments = {
+            (Qt.Horizontal, Qt.AlignLeft): (bounding_rect.left(), 0.0),
+            (Qt.Horizontal, Qt.AlignCenter): (bounding_rect.center().x(), 0.5),
+            (Qt.Horizontal, Qt.AlignRight): (bounding_rect.right(), 1.0),
+            (Qt.Vertical, Qt.AlignTop): (bounding_rect.top(), 0.0),
+            (Qt.Vertical, Qt.AlignCenter): (bounding_rect.center().y(), 0.5),
+            (Qt.Vertical, Qt.AlignBottom): (bounding_rect.bottom(), 1.0)
+        }
+
+        # Incorrect combination of axis and direction
+        if (axis, direction) not in alignments:
+            directions = {
+                Qt.AlignLeft: 'Left',
+                Qt.AlignRight: 'Right',
+                Qt.AlignTop: 'Top',
+                Qt.AlignBottom: 'Bottom',
+                Qt.AlignCenter: ' Center'
+            }
+            str_axis = 'Horizontal' if axis == Qt.Horizontal else 'Vertical'
+            str_dir = directions[direction]
+            raise ValueError(f"Cannot align '{str_dir}' in axis '{str_axis}'")
+        coordinate, fraction = alignments[(axis, direction)]
+
+        # Set the position of the items
+        if axis == Qt.Horizontal:
+            for item in items:
+                item.setX(coordinate - fraction * item.width)
+        else:
+            for item in items:
+                item.setY(coordinate - fraction * item.height)
 
     def space_selection(self, axis: Qt.Orientation = Qt.Vertical, distance: str = 'equal') -> None:
         """
@@ -1236,22 +1709,20 @@ class NodeView(QGraphicsView):
             None
         """
         # Ensure there are enough items to space
-        items: list[NodeGraphics] = [item for item in self.scene_graphics.selectedItems()
-                                     if isinstance(item, NodeGraphics)]
+        items = self._selected_nodes()
         if len(items) <= 1:
             raise ValueError('At least two nodes should be selected, cannot align')
 
         # Get the bounding rectangle of the selected items and sort the nodes by position
         bounding_rect = self._get_bounding_rect(items)
-        if axis == Qt.Horizontal:
-            items.sort(key=lambda item: item.x())
-        else:
-            items.sort(key=lambda item: item.y())
+        items.sort(key=methodcaller('x' if axis == Qt.Horizontal else 'y'))
 
         # Determine the spacing between nodes based on setting
         if distance == 'equal':
-            node_width = sum([node.width for node in items])
-            node_height = sum([node.height for node in items])
+            node_width, node_height = 0.0, 0.0
+            for node in items:
+                node_width += node.width
+                node_height += node.height
             spacing_x = (bounding_rect.right() - bounding_rect.left() - node_width) / \
                         (len(items) - 1)
             spacing_y = (bounding_rect.bottom() - bounding_rect.top() - node_height) / \
@@ -1269,30 +1740,48 @@ class NodeView(QGraphicsView):
                 item.setY(y)
             x, y = x + spacing_x + item.width, y + spacing_y + item.height
 
-    @staticmethod
-    def _get_bounding_rect(items: Iterable[QGraphicsItem]) -> QRectF:
+    def _selected_nodes(self) -> list[NodeGraphics]:
         """
-        Get the bounding rectangle of a list of items.
+        Get the graphics of the selected nodes.
 
-        Only :py:class:`~QNodeEditor.node.Node` instances are considered.
+        Returns
+        -------
+        list[:py:class:`~.node.NodeGraphics`]
+            Graphics of all selected nodes in the scene
+        """
+        return [item for item in self.scene_graphics.selectedItems()
+                if isinstance(item, NodeGraphics)]
+
+    @staticmethod
+    def _get_bounding_rect(items: Iterable[NodeGraphics]) -> QRectF:
+        """
+        Get the bounding rectangle of a list of node graphics.
 
         Parameters
         ----------
-        items : Iterable[QGraphicsItem]
-            Items to get bounding rectangle of
+        items : Iterable[:py:class:`~.node.NodeGraphics`]
+            Node graphics to get bounding rectangle of
 
         Returns
         -------
         QRectF
             Bounding rectangle of specified items
         """
-        # Find the limits of the item positions
+        # Find the limits of the item positions (reading each position and size only once)
         x_min, x_max = float('inf'), float('-inf')
         y_min, y_max = float('inf'), float('-inf')
         for item in items:
-            if isinstance(item, NodeGraphics):
-                x_min, x_max = min(x_min, item.x()), max(x_max, item.x() + item.width)
-                y_min, y_max = min(y_min, item.y()), max(y_max, item.y() + item.height)
+            pos = item.pos()
+            left, top = pos.x(), pos.y()
+            right, bottom = left + item.width, top + item.height
+            if left < x_min:
+                x_min = left
+            if right > x_max:
+                x_max = right
+            if top < y_min:
+                y_min = top
+            if bottom > y_max:
+                y_max = bottom
 
         return QRectF(x_min, y_min, x_max - x_min, y_max - y_min)
 
@@ -1,4 +1,6 @@
 """Class handling history for node scenes"""
+from collections import deque
+from itertools import islice
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -6,7 +8,13 @@ if TYPE_CHECKING:
 
 
 class History:
-    """Class that handles state history for node scenes"""
+    """
+    Class that handles state history for node scenes
+
+    The first stamp in the history stack holds a full snapshot of the scene state. Every later stamp
+    only holds the node and edge states that changed compared to the stamp before it. Unchanged
+    states are shared between stamps and are never modified.
+    """
 
     def __init__(self, scene: 'NodeScene', enabled: bool = True):
         """
@@ -17,10 +25,12 @@ class History:
         self.scene: 'NodeScene' = scene
         self.enabled: bool = enabled
 
-        # Set tracking variables
-        self._stack: list[dict] = [self.scene.get_state()]
-        self._current_step: int = 0
+        # Set tracking variables (the oldest stamp is dropped once the stack limit is reached)
         self._limit: int = 32
+        self._stack: deque[dict] = deque(maxlen=self._limit)
+        self._current_step: int = 0
+        self._state: dict = {}
+        self.reset()
 
     def undo(self) -> None:
         """
@@ -33,8 +43,8 @@ class History:
 
         # Move one step back in the stack (if possible)
         if self._current_step > 0:
-            self._restore()
             self._current_step -= 1
+            self._restore()
 
     def redo(self) -> None:
         """
@@ -60,13 +70,19 @@ class History:
         if not self.enabled:
             return
 
-        # Clear any history after the current step
-        if self._current_step < len(self._stack) - 1:
-            self._stack = self._stack[:self._current_step - 1]
-
-        # Remove the last element if the history stack limit is reached
-        if self._current_step >= self._limit - 1:
-            self._stack = self._stack[1:]
+        # Clear any history after the current step (keeping the current step itself)
+        while len(self._stack) > self._current_step + 1:
+            self._stack.pop()
+
+        # If the history stack limit is reached, drop the oldest snapshot and turn the stamp after
+        # it into the new full snapshot
+        if len(self._stack) == self._limit:
+            snapshot = self._stack.popleft()['snapshot']
+            stamp = self._stack[0]
+            self._stack[0] = {
+                'description': stamp['description'],
+                'snapshot': self._apply_delta(snapshot, stamp['delta'])
+            }
             self._current_step -= 1
 
         # Add a new stamp to the stack
@@ -85,18 +101,31 @@ class History:
         Clear the history of all stamps and store current state
         :return: None
         """
-        self._stack = [self.scene.get_state()]
+        self._state = self.scene.get_state()
+        self._stack.clear()
+        self._stack.append({
+            'description': 'Initial state',
+            'snapshot': self._state
+        })
         self._current_step = 0
 
     def _create_stamp(self, description: str) -> dict:
         """
-        Add a new snapshot to the history stack with a description of the change
+        Create a new history stamp with the changes since the current step and a description of them
         :param description: description of the change for this stamp
         :return: dict: new history stamp
         """
+        state = self.scene.get_state()
+        delta = {
+            'nodes': self._diff(self._state['nodes'], state['nodes']),
+            'edges': self._diff(self._state['edges'], state['edges'])
+        }
+
+        # Keep the unchanged node and edge states of the current step, so all stamps share them
+        self._state = self._apply_delta(self._state, delta)
         return {
             'description': description,
-            'snapshot': self.scene.get_state()
+            'delta': delta
         }
 
     def _restore(self) -> None:
@@ -104,5 +133,95 @@ class History:
         Restore the current step to the scene
         :return: None
         """
-        stamp: dict = self._stack[self._current_step]
-        self.scene.set_state(stamp['snapshot'], reset_history=False)
+        # Apply the changes of all stamps up to the current step to the full snapshot
+        state = self._stack[0]['snapshot']
+        for stamp in islice(self._stack, 1, self._current_step + 1):
+            state = self._apply_delta(state, stamp['delta'])
+        self._state = state
+        self.scene.set_state(state)
+
+    @staticmethod
+    def _keys(items: list[dict]) -> list[tuple]:
+        """
+        Get a key for every (node or edge) state in a list that identifies it between stamps
+        :param items: list of (node or edge) states
+        :return: list[tuple]: socket IDs of the state and how many earlier states had the same IDs
+        """
+        keys = []
+        counts = {}
+        for item in items:
+            # Identify nodes by the IDs of their sockets, and edges by the IDs they connect
+            if 'entries' in item:
+                ids = tuple(entry['socket']['id'] for entry in item['entries']
+                            if entry.get('socket') is not None)
+            else:
+                ids = (item.get('start'), item.get('end'))
+
+            # Tell apart states with the same IDs (such as nodes without sockets) by occurrence
+            count = counts.get(ids, 0)
+            counts[ids] = count + 1
+            keys.append((ids, count))
+        return keys
+
+    @classmethod
+    def _diff(cls, old: list[dict], new: list[dict]) -> dict:
+        """
+        Get the states that were removed, added, or changed between an older and newer list
+        :param old: older list of (node or edge) states
+        :param new: newer list of (node or edge) states
+        :return: dict: keys of removed states, changed and added states by key, and the new order
+            of all keys (only if it does not follow from the removed and added states)
+        """
+        old_keys, new_keys = cls._keys(old), cls._keys(new)
+        old_lookup = dict(zip(old_keys, old))
+        new_key_set = set(new_keys)
+
+        # Find the removed, changed, and added states
+        removed = [key for key in old_keys if key not in new_key_set]
+        changed = {key: item for key, item in zip(new_keys, new) if old_lookup.get(key) != item}
+
+        # Only store the order if it is not the remaining order with added states at the end
+        order = [key for key in old_keys if key in new_key_set]
+        order.extend(key for key in new_keys if key not in old_lookup)
+        return {
+            'removed': removed,
+            'changed': changed,
+            'order': None if order == new_keys else new_keys
+        }
+
+    @classmethod
+    def _apply_delta(cls, state: dict, delta: dict) -> dict:
+        """
+        Get a scene state with the changes of a history stamp applied to it
+        :param state: scene state to apply the changes to
+        :param delta: node and edge state changes of a history stamp
+        :return: dict: changed scene state (sharing unchanged node and edge states)
+        """
+        return {
+            'nodes': cls._patch(state['nodes'], delta['nodes']),
+            'edges': cls._patch(state['edges'], delta['edges'])
+        }
+
+    @classmethod
+    def _patch(cls, items: list[dict], diff: dict) -> list[dict]:
+        """
+        Get a list of states with the changes from :py:meth:`_diff` applied to it
+        :param items: list of (node or edge) states to apply the changes to
+        :param diff: removed, changed, and added states and (if needed) the new order
+        :return: list[dict]: changed list of states
+        """
+        keys = cls._keys(items)
+        changed = diff['changed']
+
+        # Put the states in the stored order if there is one
+        if diff['order'] is not None:
+            lookup = dict(zip(keys, items))
+            lookup.update(changed)
+            return [lookup[key] for key in diff['order']]
+
+        # Otherwise, keep the remaining states in place and add the new states at the end
+        removed = set(diff['removed'])
+        patched = [changed.get(key, item) for key, item in zip(keys, items) if key not in removed]
+        existing = set(keys)
+        patched.extend(item for key, item in changed.items() if key not in existing)
+        return patched
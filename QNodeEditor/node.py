@@ -513,6 +513,7 @@ class Node(QObject, metaclass=ObjectMeta):
         while len(self.entries) > 0:
             entry = self.entries.pop(0)
             entry.remove()
+        self.graphics.update_geometry()
 
     def update_entries(self) -> None:
         """
@@ -524,6 +525,7 @@ class Node(QObject, metaclass=ObjectMeta):
 
         :meta private:
         """
+        self.graphics.update_geometry()
         for entry in self.entries:
             entry.update_geometry()
 
@@ -1078,3 +1080,20 @@ class Node(QObject, metaclass=ObjectMeta):
             result &= entry.set_state(entry_state, restore_id)
 
         return result & True
+
+    def clone(self) -> 'Node':
+        """
+        Create a copy of this node.
+
+        The copy has the same title, position, entry values, and custom values (see
+        :py:meth:`save` and :py:meth:`load`) as this node, but its sockets get new unique IDs. The
+        copy is not added to a scene.
+
+        Returns
+        -------
+        :py:class:`Node`
+            Copy of this node
+        """
+        duplicate = type(self)()
+        duplicate.set_state(self.get_state(), restore_id=False)
+        return duplicate
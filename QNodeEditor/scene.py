@@ -74,6 +74,8 @@ class NodeScene(QObject, metaclass=ObjectMeta):
     """pyqtSignal -> Exception: Signal that emits the error if once occurs during evaluation"""
     progress: pyqtSignal = pyqtSignal(float)
     """pyqtSignal -> Signal that emits the current progress of the evaluation [0.0, 1.0]"""
+    available_nodes_changed: pyqtSignal = pyqtSignal()
+    """pyqtSignal: Signal that is emitted when the available nodes are set"""
 
     # Create scene thread reference
     _thread: QThread = None
@@ -368,6 +370,7 @@ class NodeScene(QObject, metaclass=ObjectMeta):
         _parse(new_available_nodes)
 
         self._available_nodes = new_available_nodes
+        self.available_nodes_changed.emit()
 
     def available_codes(self) -> list[int]:
         """